@@ -27,11 +27,7 @@ import yfinance as yf
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.config.benchmark_yaml import parse_allocation_fraction
 from src.config.logging_config import get_logger
-
-try:
-    from src.models.portfolio_csv_builder import STARTING_CASH
-except ImportError:
-    from models.portfolio_csv_builder import STARTING_CASH
+from src.models.portfolio_csv_builder import STARTING_CASH
 
 logger = get_logger(__name__)
 
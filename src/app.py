@@ -95,9 +95,10 @@ def main():
         summary = portfolio_controller.get_portfolio_summary()
 
         # Get the latest available date from portfolio totals for accuracy
+        # (the totals come back sorted by Date)
         totals_df = portfolio_controller.get_portfolio_total_data()
         latest_date = (
-            totals_df["Date"].max() if not totals_df.empty else summary["as_of_date"]
+            totals_df["Date"].iat[-1] if not totals_df.empty else summary["as_of_date"]
         )
         latest_date_date = pd.to_datetime(latest_date).date()
 
@@ -0,0 +1,92 @@
+"""
+Numeric kernels for portfolio period returns.
+
+This module holds the lookup math behind ReturnsCalculator's batch period
+returns: for every as-of date, each period start is snapped to a trading day
+with a binary search over the date-ordered history, and the return against
+that day's first row is taken. Dates are int64 nanoseconds (NaT-free and
+sorted) and values float64. The kernel is JIT-compiled with numba when it is
+installed; otherwise a plain NumPy implementation with identical results is
+used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _period_returns_loop(dates, values, current, targets, snap_forward):
+    """
+    Period returns (%) for many as-of dates in one compiled loop.
+
+    Args:
+        dates: sorted int64 ns dates of the history
+        values: float64 portfolio values aligned with dates
+        current: int64 ns as-of dates, shape (m,)
+        targets: int64 ns period starts per as-of date, shape (m, k)
+        snap_forward: bool per period; True snaps to the first trading day
+            on/after the start, False to the last one on/before it
+
+    Returns:
+        np.ndarray: shape (m, k); NaN where the as-of date is not in the
+        history, its value is zero, no trading day matches the period start,
+        or the start value is zero
+    """
+    n = dates.size
+    m, k = targets.shape
+    out = np.full((m, k), np.nan)
+    for i in range(m):
+        pos = np.searchsorted(dates, current[i])
+        if pos >= n or dates[pos] != current[i]:
+            continue
+        current_value = values[pos]
+        if current_value == 0.0:
+            continue
+        for j in range(k):
+            if snap_forward[j]:
+                p = np.searchsorted(dates, targets[i, j])
+            else:
+                p = np.searchsorted(dates, targets[i, j], side="right") - 1
+            if p < 0 or p >= n:
+                continue
+            # Step back to the first row of the snapped date
+            p = np.searchsorted(dates, dates[p])
+            previous_value = values[p]
+            if previous_value != 0.0:
+                out[i, j] = (current_value / previous_value - 1.0) * 100.0
+    return out
+
+
+def _period_returns_numpy(dates, values, current, targets, snap_forward):
+    """NumPy fallback for _period_returns_loop when numba is unavailable."""
+    n = dates.size
+    out = np.full(targets.shape, np.nan)
+    if n == 0:
+        return out
+
+    pos = np.searchsorted(dates, current)
+    clipped = np.minimum(pos, n - 1)
+    current_value = values[clipped]
+    valid = (pos < n) & (dates[clipped] == current) & (current_value != 0.0)
+
+    p = np.where(
+        snap_forward,
+        np.searchsorted(dates, targets, side="left"),
+        np.searchsorted(dates, targets, side="right") - 1,
+    )
+    found = (p >= 0) & (p < n) & valid[:, None]
+    previous_value = values[np.searchsorted(dates, dates[np.clip(p, 0, n - 1)])]
+    found &= previous_value != 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = (current_value[:, None] / previous_value - 1.0) * 100.0
+    out[found] = returns[found]
+    return out
+
+
+if njit is not None:
+    _period_returns_kernel = njit(cache=True)(_period_returns_loop)
+else:
+    _period_returns_kernel = _period_returns_numpy
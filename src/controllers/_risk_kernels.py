@@ -0,0 +1,80 @@
+"""
+Numeric kernels for portfolio risk metrics.
+
+This module holds the scalar math behind PortfolioController's risk metrics:
+volatility, downside volatility, mean return and maximum drawdown come out of
+one pass over a NaN-free daily returns array. The kernel is JIT-compiled with
+numba when it is installed; otherwise a plain NumPy implementation with
+identical results is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _risk_moments_loop(r):
+    """
+    Single fused pass over NaN-free daily returns.
+
+    Returns:
+        tuple: (mean, std, downside std, maximum drawdown); the standard
+        deviations use ddof=1 and are NaN with fewer than two observations
+    """
+    n = r.size
+    if n == 0:
+        return np.nan, np.nan, np.nan, 0.0
+
+    s = 0.0
+    ss = 0.0
+    neg_count = 0
+    neg_s = 0.0
+    neg_ss = 0.0
+    cumulative = 1.0
+    peak = 1.0
+    max_drawdown = 0.0
+    for i in range(n):
+        ri = r[i]
+        s += ri
+        ss += ri * ri
+        if ri < 0.0:
+            neg_count += 1
+            neg_s += ri
+            neg_ss += ri * ri
+        cumulative *= 1.0 + ri
+        if i == 0 or cumulative > peak:
+            peak = cumulative
+        drawdown = cumulative / peak - 1.0
+        max_drawdown = min(max_drawdown, drawdown)
+
+    mean = s / n
+    std = np.nan
+    if n > 1:
+        var = (ss - s * s / n) / (n - 1)
+        std = np.sqrt(var) if var > 0.0 else 0.0
+    downside_std = np.nan
+    if neg_count > 1:
+        neg_var = (neg_ss - neg_s * neg_s / neg_count) / (neg_count - 1)
+        downside_std = np.sqrt(neg_var) if neg_var > 0.0 else 0.0
+    return mean, std, downside_std, max_drawdown
+
+
+def _risk_moments_numpy(r):
+    """NumPy fallback for _risk_moments_loop when numba is unavailable."""
+    if r.size == 0:
+        return np.nan, np.nan, np.nan, 0.0
+    downside = r[r < 0]
+    std = r.std(ddof=1) if r.size > 1 else np.nan
+    downside_std = downside.std(ddof=1) if downside.size > 1 else np.nan
+    cumulative = np.cumprod(1 + r)
+    max_drawdown = (cumulative / np.maximum.accumulate(cumulative) - 1).min()
+    return r.mean(), std, downside_std, max_drawdown
+
+
+if njit is not None:
+    _risk_moments_kernel = njit(cache=True, fastmath=True)(_risk_moments_loop)
+else:
+    _risk_moments_kernel = _risk_moments_numpy
@@ -9,69 +9,186 @@ It provides methods for:
 """
 
 import os
+import numpy as np
 import pandas as pd
+from functools import cached_property
+from .data_service import read_csv
 
 # TODO: This is a temporary solution to get the benchmark data.
 
 
+def pct_change_values(arr: np.ndarray) -> np.ndarray:
+    """
+    Period-over-period % change of a value array, like Series.pct_change().
+
+    The first element is NaN; the rest are three vectorized ops into one
+    preallocated float64 buffer.
+    """
+    v = np.asarray(arr, dtype=np.float64)
+    r = np.empty_like(v)
+    if v.size == 0:
+        return r
+    r[0] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(v[1:], v[:-1], out=r[1:])
+    r[1:] -= 1.0
+    return r
+
+
+def sorted_positions(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """
+    Positions of keys in unique, ascending sorted_keys (-1 where missing).
+
+    A binary search per key, so it skips the hash table Index.get_indexer builds.
+    """
+    if sorted_keys.size == 0:
+        return np.full(keys.size, -1, dtype=np.intp)
+    pos = np.searchsorted(sorted_keys, keys)
+    np.minimum(pos, sorted_keys.size - 1, out=pos)
+    pos[sorted_keys[pos] != keys] = -1
+    return pos
+
+
 class Benchmark:
-    def __init__(self, useSpy: bool = False):
-        self.OUTPUT_PATH = "data/benchmark/output"
+    OUTPUT_PATH = "data/benchmark/output"
 
+    def __init__(self, useSpy: bool = False):
         if useSpy:
             self.benchmark_df = self.get_spy_benchmark()
         else:
             # Read prebuilt totals
-            self.benchmark_df = pd.read_csv(
+            # read_csv has already parsed the Date column
+            self.benchmark_df = read_csv(
                 os.path.join(self.OUTPUT_PATH, "portfolio_total.csv")
             )
-            if "Date" in self.benchmark_df.columns:
-                self.benchmark_df["Date"] = pd.to_datetime(self.benchmark_df["Date"])
-            # Ensure daily % change exists
-            if "Total_Portfolio_Value" in self.benchmark_df.columns:
-                self.benchmark_df["pct_change"] = self.benchmark_df[
-                    "Total_Portfolio_Value"
-                ].pct_change()
-            elif "Total Mkt Val" in self.benchmark_df.columns:
-                self.benchmark_df["pct_change"] = self.benchmark_df[
-                    "Total Mkt Val"
-                ].pct_change()
+
+        # Daily benchmark returns, computed once so consumers never re-derive them
+        self.benchmark_returns = pd.Series(
+            self._pct_change_array, index=self.benchmark_df.index
+        ).dropna()
+
+    @classmethod
+    def _snapshot_mtime(cls, useSpy: bool = False) -> int:
+        """
+        Latest modification time (ns) of the files backing this benchmark.
+
+        Used as a cheap data fingerprint for sharing Benchmark instances; 0 when a
+        source file is missing (construction will then raise as usual).
+        """
+        names = (
+            ("prices.csv", "dividend_income.csv")
+            if useSpy
+            else ("portfolio_total.csv",)
+        )
+        try:
+            return max(
+                os.stat(os.path.join(cls.OUTPUT_PATH, name)).st_mtime_ns
+                for name in names
+            )
+        except FileNotFoundError:
+            return 0
+
+    @cached_property
+    def _pct_change_array(self) -> np.ndarray:
+        """
+        Daily % change per benchmark_df row (the first is NaN), as a float64 array.
+
+        Computed once on the raw ndarray; benchmark_df itself is never mutated.
+        The array is read-only: it can be a view into benchmark_df, and the
+        instance is shared by every MarketComparison for the same data.
+        """
+        if "pct_change" in self.benchmark_df.columns:
+            pct_change = self.benchmark_df["pct_change"].to_numpy(dtype=np.float64)
+        else:
+            pct_change = np.full(len(self.benchmark_df), np.nan)
+            for value_col in ("Total_Portfolio_Value", "Total Mkt Val"):
+                if value_col in self.benchmark_df.columns:
+                    pct_change = pct_change_values(
+                        self.benchmark_df[value_col].to_numpy(dtype=np.float64)
+                    )
+                    break
+        pct_change.setflags(write=False)
+        return pct_change
+
+    def pct_change_array(self) -> np.ndarray:
+        """Daily benchmark returns aligned to benchmark_df rows (read-only view)."""
+        return self._pct_change_array
+
+    @cached_property
+    def _date_index(self):
+        if "Date" not in self.benchmark_df.columns:
+            return None
+        dates = pd.DatetimeIndex(self.benchmark_df["Date"])
+        return dates if dates.is_unique else None
+
+    def date_positions(self, dates):
+        """
+        Map dates to benchmark_df row positions.
+
+        Returns:
+            np.ndarray of positions (-1 where a date is missing), or None when the
+            benchmark has no unique Date column to map against
+        """
+        if self._date_index is None:
+            return None
+        dates = pd.DatetimeIndex(pd.to_datetime(dates))
+        if self._date_index.is_monotonic_increasing:
+            keys = self._date_index.to_numpy()
+            return sorted_positions(keys, dates.to_numpy().astype(keys.dtype))
+        return self._date_index.get_indexer(dates)
 
     def get_spy_benchmark(self) -> pd.DataFrame:
-        prices = pd.read_csv(os.path.join(self.OUTPUT_PATH, "prices.csv"))
-        prices["Date"] = pd.to_datetime(prices["Date"])
+        prices = read_csv(os.path.join(self.OUTPUT_PATH, "prices.csv"))
         price_series = prices.set_index("Date")["SPY"]
 
         # Dividend income per day for SPY in USD-equivalent terms (as built by the builder)
-        div_df = pd.read_csv(os.path.join(self.OUTPUT_PATH, "dividend_income.csv"))[
+        div_df = read_csv(os.path.join(self.OUTPUT_PATH, "dividend_income.csv"))[
             ["Date", "SPY"]
         ]
-        div_df["Date"] = pd.to_datetime(div_df["Date"])
         div_series = div_df.set_index("Date")["SPY"]
 
         # Align to price index and fill missing with zeros
         div_series = div_series.reindex(price_series.index).fillna(0.0)
         div_cumsum = div_series.cumsum()
 
-        benchmark_df = price_series.to_frame(name="Price").copy()
+        benchmark_df = price_series.to_frame(name="Price")
         benchmark_df["dividends cumsum"] = div_cumsum
         benchmark_df["Total"] = benchmark_df["Price"] + benchmark_df["dividends cumsum"]
-        benchmark_df["pct_change"] = benchmark_df["Total"].pct_change()
+        benchmark_df["pct_change"] = pct_change_values(
+            benchmark_df["Total"].to_numpy(dtype=np.float64)
+        )
         benchmark_df.reset_index(inplace=True)
         benchmark_df.rename(columns={"index": "Date"}, inplace=True)
         return benchmark_df
 
-    def benchmark_variance(self):
-        daily_benchmark_variance = self.benchmark_df["pct_change"].dropna().var()
+    # The benchmark statistics below are computed once per instance; instances
+    # are shared across MarketComparison objects for the same data snapshot.
+    # They reduce the NaN-free returns array directly (ddof=1, like pandas).
+    @cached_property
+    def _variance(self):
+        r = self.benchmark_returns.to_numpy()
+        daily_benchmark_variance = r.var(ddof=1) if r.size > 1 else np.nan
         annualized_benchmark_variance = daily_benchmark_variance * 252
         return daily_benchmark_variance, annualized_benchmark_variance
 
-    def benchmark_volatility(self):
-        daily_benchmark_volatility = self.benchmark_df["pct_change"].dropna().std()
+    @cached_property
+    def _volatility(self):
+        daily_benchmark_volatility = np.sqrt(self._variance[0])
         annualized_benchmark_volatility = daily_benchmark_volatility * (252**0.5)
         return daily_benchmark_volatility, annualized_benchmark_volatility
 
-    def benchmark_average_return(self):
-        daily_benchmark_return = self.benchmark_df["pct_change"].dropna().mean()
+    @cached_property
+    def _average_return(self):
+        r = self.benchmark_returns.to_numpy()
+        daily_benchmark_return = r.mean() if r.size else np.nan
         annualized_benchmark_return = (1 + daily_benchmark_return) ** 252 - 1
         return daily_benchmark_return, annualized_benchmark_return
+
+    def benchmark_variance(self):
+        return self._variance
+
+    def benchmark_volatility(self):
+        return self._volatility
+
+    def benchmark_average_return(self):
+        return self._average_return
@@ -9,15 +9,86 @@ This service layer provides:
 """
 
 import os
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import hashlib
+from functools import lru_cache
 from ..config.logging_config import get_logger
 
 # Set up logger for this module
 logger = get_logger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+
+    _HAS_PYARROW = True
+except ImportError:  # pyarrow is optional
+    _HAS_PYARROW = False
+
+_CSV_ENGINE = "pyarrow" if _HAS_PYARROW else "c"
+
+
+# Keep a parquet copy of each parsed CSV under <folder>/.cache and read that
+# instead while it is at least as new as the CSV. Set to False to always parse
+# the CSVs (e.g. while the builder is rewriting them).
+USE_PARQUET_CACHE = True
+
+
+def _parquet_cache_path(file_path: str) -> str:
+    folder, name = os.path.split(file_path)
+    return os.path.join(folder, ".cache", os.path.splitext(name)[0] + ".parquet")
+
+
+@lru_cache(maxsize=32)
+def _read_csv_cached(file_path: str, mtime_ns: int) -> pd.DataFrame:
+    use_parquet = USE_PARQUET_CACHE and _HAS_PYARROW
+    parquet_path = _parquet_cache_path(file_path)
+    if use_parquet:
+        try:
+            if os.stat(parquet_path).st_mtime_ns >= mtime_ns:
+                return pd.read_parquet(parquet_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parquet cache {parquet_path}: {e}")
+
+    df = pd.read_csv(file_path, engine=_CSV_ENGINE)
+    # Parse the Date column once here rather than in every caller
+    if "Date" in df.columns:
+        df["Date"] = pd.to_datetime(df["Date"])
+
+    if use_parquet:
+        try:
+            os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+            df.to_parquet(parquet_path, compression="snappy")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write parquet cache {parquet_path}: {e}")
+    return df
+
+
+# Low-cardinality label columns of holdings.csv, stored dictionary-encoded
+_HOLDINGS_CATEGORY_COLUMNS = ("ticker", "currency", "sector", "asset_class", "status")
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the holdings label columns present in df to categoricals in place."""
+    for col in _HOLDINGS_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def read_csv(file_path: str) -> pd.DataFrame:
+    """
+    Read a builder output CSV, using the multi-threaded pyarrow parser when installed.
+
+    Parsed frames are memoized per (path, mtime), so a file read several times in
+    one request is only parsed once; each caller gets its own copy to modify.
+    """
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    return _read_csv_cached(file_path, mtime_ns).copy()
+
 
 class DataService:
     """Centralized data service for portfolio data management"""
@@ -31,15 +102,35 @@ class DataService:
 
         # Cache for DataFrames
         self._data_cache: Dict[str, Tuple[pd.DataFrame, datetime]] = {}
+        # (mtime_ns, size) of each cache entry's source files when it was loaded
+        self._source_signatures: Dict[str, list] = {}
+        # Date -> row position map for the cached portfolio totals frame
+        self._total_positions: Optional[Tuple[pd.DataFrame, pd.Series]] = None
         self._cache_duration = timedelta(minutes=30)  # Cache for 30 minutes
 
-    def _get_file_hash(self, filepath: str) -> str:
-        """Get file hash for cache invalidation"""
-        if not os.path.exists(filepath):
-            return "nonexistent"
+    @property
+    def cache_version(self) -> int:
+        """
+        Snapshot of the builder outputs: the newest CSV mtime (ns) in the output
+        folder, so it changes whenever the builder rewrites any of them.
+        """
+        try:
+            with os.scandir(self.output_folder) as entries:
+                return max(
+                    (e.stat().st_mtime_ns for e in entries if e.name.endswith(".csv")),
+                    default=0,
+                )
+        except FileNotFoundError:
+            return 0
 
-        with open(filepath, "rb") as f:
-            return hashlib.md5(f.read()).hexdigest()
+    @staticmethod
+    def _file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a source file, or None when it does not exist"""
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def _is_cache_valid(self, cache_key: str, source_files: list) -> bool:
         """Check if cache is still valid based on source file timestamps"""
@@ -50,39 +141,19 @@ class DataService:
         if datetime.now() - cached_time > self._cache_duration:
             return False
 
-        # Check if source files have changed
-        for filepath in source_files:
-            if not os.path.exists(filepath):
-                return False
-            file_hash = self._get_file_hash(filepath)
-            cache_file = os.path.join(
-                self.cache_dir, f"{cache_key}_{os.path.basename(filepath)}.hash"
-            )
-
-            if not os.path.exists(cache_file):
-                return False
-
-            with open(cache_file, "r") as f:
-                cached_hash = f.read().strip()
-
-            if file_hash != cached_hash:
-                return False
-
-        return True
+        # Check if source files have changed: one stat per file rather than
+        # re-reading and hashing its contents
+        signatures = [self._file_signature(f) for f in source_files]
+        if None in signatures:
+            return False
+        return self._source_signatures.get(cache_key) == signatures
 
     def _update_cache(self, cache_key: str, data: pd.DataFrame, source_files: list):
-        """Update cache with new data and file hashes"""
+        """Update cache with new data and source file signatures"""
         self._data_cache[cache_key] = (data, datetime.now())
-
-        # Store file hashes
-        for filepath in source_files:
-            if os.path.exists(filepath):
-                file_hash = self._get_file_hash(filepath)
-                cache_file = os.path.join(
-                    self.cache_dir, f"{cache_key}_{os.path.basename(filepath)}.hash"
-                )
-                with open(cache_file, "w") as f:
-                    f.write(file_hash)
+        self._source_signatures[cache_key] = [
+            self._file_signature(f) for f in source_files
+        ]
 
     def get_portfolio_total_data(self) -> pd.DataFrame:
         """Get portfolio total data (market values + cash)"""
@@ -98,10 +169,13 @@ class DataService:
                 f"Expected portfolio_total.csv at {source_file}. Please build the portfolio outputs first."
             )
 
-        result = pd.read_csv(source_file)
-        # Ensure proper dtypes and ordering
-        result["Date"] = pd.to_datetime(result["Date"])
-        result = result.sort_values("Date")
+        result = read_csv(source_file)
+        # Ensure proper dtypes and ordering. The builder writes Date in order, so
+        # only re-sort (a full copy of every column) when it is not
+        if not pd.api.types.is_datetime64_any_dtype(result["Date"]):
+            result["Date"] = pd.to_datetime(result["Date"])
+        if not result["Date"].is_monotonic_increasing:
+            result = result.sort_values("Date")
 
         # Compute pct_change if not present
         if "pct_change" not in result.columns:
@@ -110,6 +184,51 @@ class DataService:
         self._update_cache(cache_key, result, [source_file])
         return result
 
+    def get_portfolio_total_position(
+        self, as_of_date=None, totals_df: Optional[pd.DataFrame] = None
+    ) -> Optional[int]:
+        """
+        Row position of the portfolio totals for a date, via a cached date -> row map.
+
+        Falls back to the latest row when as_of_date is None or not in the data.
+        Pass totals_df when the caller already holds get_portfolio_total_data()
+        to skip a second cache validation. Returns None when there is no data.
+        """
+        if totals_df is None:
+            totals_df = self.get_portfolio_total_data()
+        if totals_df.empty:
+            return None
+
+        # Rebuild the map only when the cached frame itself was reloaded
+        if self._total_positions is None or self._total_positions[0] is not totals_df:
+            first = ~totals_df["Date"].duplicated().to_numpy()
+            positions = pd.Series(
+                np.flatnonzero(first),
+                index=pd.DatetimeIndex(totals_df["Date"].to_numpy()[first]),
+            )
+            self._total_positions = (totals_df, positions)
+
+        pos = None
+        if as_of_date is not None:
+            pos = self._total_positions[1].get(pd.to_datetime(as_of_date))
+        return len(totals_df) - 1 if pos is None else int(pos)
+
+    def get_portfolio_total_row(
+        self, as_of_date=None, totals_df: Optional[pd.DataFrame] = None
+    ) -> Tuple[Optional[pd.Timestamp], Optional[pd.Series]]:
+        """
+        Portfolio totals row for a date (see get_portfolio_total_position).
+
+        Returns (date, row), or (None, None) when there is no data.
+        """
+        if totals_df is None:
+            totals_df = self.get_portfolio_total_data()
+        pos = self.get_portfolio_total_position(as_of_date, totals_df)
+        if pos is None:
+            return None, None
+        row = totals_df.iloc[pos]
+        return row["Date"], row
+
     def get_holdings_summary(self) -> pd.DataFrame:
         """Get per-ticker holdings summary from holdings.csv"""
         cache_key = "holdings_summary"
@@ -123,7 +242,7 @@ class DataService:
             return self._data_cache[cache_key][0]
 
         try:
-            df = pd.read_csv(source_file)
+            df = read_csv(source_file)
             # Ensure expected columns and dtypes
             for col in [
                 "shares",
@@ -138,7 +257,7 @@ class DataService:
             ]:
                 if col in df.columns:
                     df[col] = pd.to_numeric(df[col], errors="coerce")
-            df = df.sort_values("market_value", ascending=False)
+            df = _categorize(df.sort_values("market_value", ascending=False))
         except Exception as e:
             logger.exception(f"Error loading holdings summary: {e}")
             return pd.DataFrame()
@@ -154,7 +273,7 @@ class DataService:
         if self._is_cache_valid(cache_key, [source_files]):
             return self._data_cache[cache_key][0]
 
-        df = pd.read_csv(source_files)
+        df = _categorize(read_csv(source_files))
         self._update_cache(cache_key, df, [source_files])
         return df
 
@@ -164,46 +283,49 @@ class DataService:
         cash_file = os.path.join(self.output_folder, "cash.csv")
         fx_file = os.path.join(self.output_folder, "exchange_rates.csv")
 
+        # Cache the date-indexed frames rather than one date's result, so every
+        # as_of_date is served from the same parse
         if self._is_cache_valid(cache_key, [cash_file, fx_file]):
-            return self._data_cache[cache_key][0]
-
-        cash_df = pd.read_csv(cash_file)
-        cash_df["Date"] = pd.to_datetime(cash_df["Date"])
+            cash_df, rate_series = self._data_cache[cache_key][0]
+        else:
+            cash_df = read_csv(cash_file)
+            cash_df["Date"] = pd.to_datetime(cash_df["Date"])
+            cash_df = cash_df.set_index("Date").sort_index(kind="stable")
+
+            # Load exchange rates to provide USD→CAD rate on the same date
+            try:
+                fx_df = read_csv(fx_file)
+                fx_df["Date"] = pd.to_datetime(fx_df["Date"])
+                rate_series = fx_df.set_index("Date")["USD"].sort_index(kind="stable")
+            except Exception:
+                rate_series = None
+            self._update_cache(cache_key, (cash_df, rate_series), [cash_file, fx_file])
 
         if as_of_date is None:
-            as_of_dt = cash_df["Date"].max()
+            as_of_dt = cash_df.index.max()
         else:
             as_of_dt = pd.to_datetime(as_of_date)
 
-        # Load exchange rates to provide USD→CAD rate on the same date
+        # Rate on the date, or the closest previous one (binary search on the index)
         usd_cad_rate = None
-        try:
-            fx_df = pd.read_csv(fx_file)
-            fx_df["Date"] = pd.to_datetime(fx_df["Date"])
-            rate_series = fx_df.set_index("Date")["USD"]
-            if as_of_dt in rate_series.index:
-                usd_cad_rate = float(rate_series.loc[as_of_dt])
-            else:
-                prior = rate_series[rate_series.index <= as_of_dt]
-                usd_cad_rate = float(prior.iloc[-1]) if not prior.empty else None
-        except Exception:
-            usd_cad_rate = None
-
-        cash_row = cash_df[cash_df["Date"] == as_of_dt]
-        if cash_row.empty:
-            cash_row = cash_df.iloc[[-1]]
-        cash_row = cash_row.iloc[0]
-
-        result = {
+        if rate_series is not None and not rate_series.empty:
+            rate = rate_series.asof(as_of_dt)
+            usd_cad_rate = float(rate) if pd.notna(rate) else None
+
+        # Exact date when present, otherwise the latest row
+        pos = cash_df.index.searchsorted(as_of_dt)
+        if pos == len(cash_df) or cash_df.index[pos] != as_of_dt:
+            pos = len(cash_df) - 1
+        # One dict conversion instead of a Series label lookup per field
+        cash_row = cash_df.iloc[pos].to_dict()
+
+        return {
             "CAD_Cash": float(cash_row["CAD_Cash"]),
             "USD_Cash": float(cash_row["USD_Cash"]),
             "Total_CAD": float(cash_row["Total_CAD"]),
             "USD_CAD_Rate": usd_cad_rate,
         }
 
-        self._update_cache(cache_key, result, [cash_file, fx_file])
-        return result
-
     def get_dividend_data(self) -> pd.DataFrame:
         """Get dividend income data"""
         cache_key = "dividends"
@@ -212,7 +334,7 @@ class DataService:
         if self._is_cache_valid(cache_key, [source_file]):
             return self._data_cache[cache_key][0]
 
-        dividends_df = pd.read_csv(source_file)
+        dividends_df = read_csv(source_file)
         dividends_df["Date"] = pd.to_datetime(dividends_df["Date"])
 
         self._update_cache(cache_key, dividends_df, [source_file])
@@ -221,9 +343,13 @@ class DataService:
     def clear_cache(self):
         """Clear all cached data"""
         self._data_cache.clear()
-        for file in os.listdir(self.cache_dir):
-            if file.endswith(".hash"):
-                os.remove(os.path.join(self.cache_dir, file))
+        self._source_signatures.clear()
+        self._total_positions = None
+        # Remove file hashes left by older versions of the cache
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".hash") and entry.is_file():
+                    os.remove(entry.path)
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about current cache status"""
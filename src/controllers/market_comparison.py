@@ -12,134 +12,539 @@ It provides methods for:
 This module focuses on comparative analysis and assumes benchmark data is available.
 """
 
+import hashlib
+import logging
+import math
+import os
 import pandas as pd
 import numpy as np
 import getFamaFrenchFactors as gff
-from .benchmark import Benchmark
+from ._mc_kernels import _beta_ir_kernel, _ff3_moments_kernel
+from .benchmark import Benchmark, pct_change_values, sorted_positions
+from .data_service import _HAS_PYARROW, read_csv
 from .returns_calculator import ReturnsCalculator
-from .risk_metrics import RiskMetrics
 from ..config.logging_config import get_logger
-from functools import lru_cache
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
 
 # Set up logger for this module
 logger = get_logger(__name__)
 
+_SQRT_252 = math.sqrt(252.0)
+
+# Default on-disk cache of the monthly portfolio/FF3 merge, shared across runs;
+# PortfolioController passes <data>/.cache/ff3/<portfolio> instead. Each
+# directory keeps only its newest merge, so use one directory per portfolio.
+_FF3_CACHE_DIR = os.path.join("data", ".cache", "ff3")
+
+
+def _remove_stale_ff3_files(cache_dir: str, keep_path: str) -> None:
+    """Delete every FF3 parquet file in cache_dir other than keep_path."""
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith("ff3_")
+                and entry.name.endswith(".parquet")
+                and entry.path != keep_path
+            ):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+# Benchmark instances shared across MarketComparison objects, keyed on
+# (useSpy, source-file mtime) so a rebuilt benchmark is picked up automatically
+_BENCH_CACHE: dict[tuple[bool, int], Benchmark] = {}
+
+
+def _get_benchmark(useSpy: bool) -> Benchmark:
+    """Return the shared Benchmark for the current data snapshot, building it once."""
+    key = (useSpy, Benchmark._snapshot_mtime(useSpy))
+    benchmark = _BENCH_CACHE.get(key)
+    if benchmark is None:
+        # Evict instances built from an older snapshot of the same source
+        for stale_key in [k for k in _BENCH_CACHE if k[0] == useSpy]:
+            del _BENCH_CACHE[stale_key]
+        benchmark = _BENCH_CACHE[key] = Benchmark(useSpy=useSpy)
+    return benchmark
+
+
+def _align_values(a: pd.Series, b: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Inner-join two return series on their index and return raw float32 arrays,
+    skipping positions where either side is NaN.
+
+    Sorted, unique indexes of the same dtype are joined by binary search; other
+    indexes go through the hash-backed Index.intersection/get_indexer. Neither
+    builds intermediate Series, so the result feeds the kernels directly.
+    Daily returns carry far fewer significant digits than float32 holds, so only
+    the storage is narrowed; the kernels accumulate in float64.
+    """
+    x = a.to_numpy(dtype=np.float32, copy=False)
+    y = b.to_numpy(dtype=np.float32, copy=False)
+    if (
+        a.index.dtype == b.index.dtype
+        and a.index.is_monotonic_increasing
+        and b.index.is_monotonic_increasing
+        and a.index.is_unique
+        and b.index.is_unique
+    ):
+        positions = sorted_positions(b.index.to_numpy(), a.index.to_numpy())
+        matched = positions >= 0
+        return _drop_nan_pairs(x[matched], y[positions[matched]])
+
+    idx = a.index.intersection(b.index)
+    return _drop_nan_pairs(x[a.index.get_indexer(idx)], y[b.index.get_indexer(idx)])
+
+
+def _ff3_fit(m: np.ndarray) -> dict:
+    """
+    Fit (Rp - Rf) = alpha + b_m*(Mkt-RF) + b_s*SMB + b_h*HML on an FF3Arrays.matrix.
+
+    Returns:
+        dict with keys market_factor, size_factor, value_factor, alpha, r_squared
+    """
+    # One 4x4 covariance matrix gives every OLS quantity: the slopes solve
+    # Cov(f, f) b = Cov(f, y) and the intercept comes from the column means
+    means, cov = _ff3_moments_kernel(m)
+    slopes = np.linalg.lstsq(cov[1:, 1:], cov[1:, 0], rcond=None)[0]
+    beta_mkt, beta_smb, beta_hml = slopes
+    alpha = means[0] - means[1:] @ slopes
+
+    # Explained over total variance of the excess return
+    r_squared = float(cov[1:, 0] @ slopes / cov[0, 0]) if cov[0, 0] > 0 else 0.0
+
+    return {
+        "market_factor": float(beta_mkt),
+        "size_factor": float(beta_smb),
+        "value_factor": float(beta_hml),
+        "alpha": float(alpha),  # monthly alpha (decimal)
+        "r_squared": float(r_squared),
+    }
+
+
+def _drop_nan_pairs(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Drop positions where either array is NaN, without going through Series.dropna()."""
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if not valid.all():
+        x, y = x[valid], y[valid]
+    return x, y
+
+
+@dataclass(frozen=True)
+class MarketMetrics:
+    """Benchmark-relative metrics produced together by MarketComparison.compute_all()."""
+
+    beta: float
+    alpha: float
+    treynor: float
+    information_ratio_daily: float
+    information_ratio_annual: float
+    risk_adjusted_return: float
+    risk_premium: float
+
+
+@dataclass(frozen=True)
+class FF3Arrays:
+    """
+    Monthly FF3 regression inputs as contiguous float64 columns.
+
+    The four columns are rows of one (4, N) block and matrix is its (N, 4)
+    transpose, so the moment kernel reads them without another copy.
+    """
+
+    excess: np.ndarray
+    mkt: np.ndarray
+    smb: np.ndarray
+    hml: np.ndarray
+    n: int
+    matrix: np.ndarray = field(repr=False)
+
+    @classmethod
+    def from_frame(cls, merged_df: pd.DataFrame) -> "FF3Arrays":
+        """Build from the monthly merge, subtracting RF from the portfolio return once."""
+        if merged_df.empty:
+            block = np.empty((4, 0))
+        else:
+            block = np.ascontiguousarray(
+                merged_df[["portfolio_return", "Mkt-RF", "SMB", "HML"]]
+                .to_numpy(dtype=np.float64)
+                .T
+            )
+            block[0] -= merged_df["RF"].to_numpy(dtype=np.float64)
+        # Memoized on the instance: make accidental in-place edits raise
+        block.flags.writeable = False
+        return cls(block[0], block[1], block[2], block[3], block.shape[1], block.T)
+
 
 class MarketComparison:
-    def __init__(self, df=None, useSpy: bool = False, risk_free_rate: float = 0.02):
-        # Mirror Benchmark's constructor pattern: local path constant via Benchmark and a chosen source
-        self.benchmark_instance = Benchmark(useSpy=useSpy)
-        self.df = df
+    """
+    Benchmark-relative metrics for one portfolio frame.
+
+    Build one instance per request and read every metric from it. The aligned
+    returns, annualized return/volatility, the compute_all() result and alphas
+    at other risk-free rates are memoized per instance (only the Benchmark is
+    shared across instances), so a second instance over the same frame
+    recomputes all of them.
+    """
+
+    def __init__(
+        self,
+        df=None,
+        *,
+        useSpy: bool = False,
+        risk_free_rate: float = 0.02,
+        cache_dir: Optional[str] = None,
+    ):
+        # Benchmark work only depends on the source data, so it is shared across funds
+        self.benchmark_instance = _get_benchmark(useSpy)
         self.RISK_FREE_RATE = risk_free_rate
+        # Directory of the on-disk FF3 merge cache
+        self.cache_dir = cache_dir if cache_dir is not None else _FF3_CACHE_DIR
+        self.df = df
 
-    def beta(self):
-        # Use the configured benchmark instance
-        benchmark_df = self.benchmark_instance.benchmark_df
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        # Everything memoized below derives from df, so reassigning it resets them
+        if hasattr(self, "_df"):
+            self.invalidate()
+        self._df = df
+        self._returns_calc = ReturnsCalculator(df)
+
+    def invalidate(self):
+        """Drop every cached value derived from df (call after mutating df in place)."""
+        for name in (
+            "_aligned_returns",
+            "_portfolio_ann_return",
+            "_portfolio_risk_premium",
+            "_portfolio_ann_volatility",
+            "_metrics",
+            "_alpha_by_rate",
+            "_monthly_returns_aligned_with_ff3",
+            "_ff3_arrays",
+            "_ff3_regression_results",
+        ):
+            self.__dict__.pop(name, None)
+        # The returns calculator memoizes arrays taken from df as well
+        self._returns_calc = ReturnsCalculator(self._df)
+
+    @classmethod
+    def from_folder(
+        cls,
+        folder: str,
+        useSpy: bool = False,
+        risk_free_rate: float = 0.02,
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Build a MarketComparison from a portfolio output folder.
 
-        daily_portfolio_return = self.df["pct_change"].dropna()
+        portfolio_total.csv is parsed once here; every metric then works off the
+        in-memory DataFrame instead of re-reading the CSV.
+        """
+        df = read_csv(os.path.join(folder, "portfolio_total.csv"))
+        df["Date"] = pd.to_datetime(df["Date"])
+        df = df.sort_values("Date")
+        if "pct_change" not in df.columns:
+            df["pct_change"] = pct_change_values(
+                df["Total_Portfolio_Value"].to_numpy(dtype=np.float64)
+            )
+        return cls(
+            df, useSpy=useSpy, risk_free_rate=risk_free_rate, cache_dir=cache_dir
+        )
+
+    @cached_property
+    def _portfolio_ann_return(self):
+        """Annualized average portfolio return, computed once per instance."""
+        return self._returns_calc.annualized_average_return()
+
+    @cached_property
+    def _portfolio_risk_premium(self):
+        return self._portfolio_ann_return - self.RISK_FREE_RATE
+
+    @cached_property
+    def _portfolio_ann_volatility(self):
+        """Annualized portfolio volatility, shared by every risk-adjusted return."""
+        # Deferred: only the risk-adjusted return needs RiskMetrics
+        from .risk_metrics import RiskMetrics
+
+        return RiskMetrics(self.df, self.RISK_FREE_RATE).annualized_volatility()
+
+    def _has_returns(self) -> bool:
+        """True when the portfolio frame carries a daily pct_change column."""
+        return (
+            self.df is not None
+            and not self.df.empty
+            and "pct_change" in self.df.columns
+        )
+
+    @cached_property
+    def _aligned_returns(self) -> tuple[np.ndarray, np.ndarray]:
+        """Date-aligned, NaN-free (portfolio, benchmark) daily return arrays."""
+        positions = (
+            self.benchmark_instance.date_positions(self.df["Date"])
+            if "Date" in self.df.columns
+            else None
+        )
+        if positions is None:
+            # No dates to join on: fall back to aligning on the row index
+            return _align_values(
+                self.df["pct_change"], self.benchmark_instance.benchmark_returns
+            )
 
-        # Handle empty or NaN values in benchmark pct_change
-        if "pct_change" in benchmark_df.columns:
-            daily_benchmark_return = benchmark_df["pct_change"].dropna()
+        # Join on dates through the benchmark's integer position map
+        matched = positions >= 0
+        x = self.df["pct_change"].to_numpy(dtype=np.float32)[matched]
+        y = self.benchmark_instance.pct_change_array()[positions[matched]]
+        return _drop_nan_pairs(x, y.astype(np.float32))
+
+    @cached_property
+    def _annual_benchmark_return(self):
+        return self.benchmark_instance.benchmark_average_return()[1]
+
+    @cached_property
+    def _metrics(self) -> MarketMetrics:
+        if not self._has_returns():
+            return MarketMetrics(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        nan = float("nan")
+        portfolio_values, benchmark_values = self._aligned_returns
+
+        # One pass yields beta's cov/var and the excess-return moments for IR
+        covariance, daily_benchmark_var, excess_mean, excess_std = _beta_ir_kernel(
+            portfolio_values, benchmark_values
+        )
+        # Zero or undefined benchmark variance (including an empty overlap)
+        beta = covariance / daily_benchmark_var if daily_benchmark_var > 0 else nan
+
+        risk_premium = self._portfolio_risk_premium
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"annual_benchmark_return: {self._annual_benchmark_return}")
+        alpha = risk_premium - beta * (
+            self._annual_benchmark_return - self.RISK_FREE_RATE
+        )
+        treynor = risk_premium / beta if beta != 0 and not np.isnan(beta) else nan
+
+        if excess_std > 0:
+            daily_ir = excess_mean / excess_std
+            annual_ir = daily_ir * _SQRT_252
         else:
-            # If pct_change column doesn't exist, calculate it
-            benchmark_df["pct_change"] = benchmark_df["Total Mkt Val"].pct_change()
-            daily_benchmark_return = benchmark_df["pct_change"].dropna()
-
-        # Align on dates to ensure matching observations
-        aligned = daily_portfolio_return.align(daily_benchmark_return, join="inner")
-        daily_portfolio_return, daily_benchmark_return = aligned
-        if len(daily_portfolio_return) == 0:
-            return 0.0
+            daily_ir = annual_ir = nan  # Fewer than two points or no spread
+
+        portfolio_volatility = self._portfolio_ann_volatility
+        if portfolio_volatility > 0:
+            benchmark_vol = self.benchmark_instance.benchmark_volatility()[1]
+            risk_adjusted_return = (
+                risk_premium * benchmark_vol / portfolio_volatility
+                + self.RISK_FREE_RATE
+            )
+        else:
+            risk_adjusted_return = nan
+
+        return MarketMetrics(
+            beta=beta,
+            alpha=alpha,
+            treynor=treynor,
+            information_ratio_daily=daily_ir,
+            information_ratio_annual=annual_ir,
+            risk_adjusted_return=risk_adjusted_return,
+            risk_premium=risk_premium,
+        )
+
+    def compute_all(self) -> MarketMetrics:
+        """
+        Every benchmark-relative metric from a single alignment and kernel pass.
 
-        daily_benchmark_var, _ = self.benchmark_instance.benchmark_variance()
-        if daily_benchmark_var == 0:
-            return 0.0  # Avoid division by zero
+        The result is computed once per instance; the individual metric methods
+        below read from it.
 
-        covariance = daily_portfolio_return.cov(daily_benchmark_return)
-        beta = covariance / daily_benchmark_var
+        Returns:
+            MarketMetrics with all metrics (zeros when there is no return data)
+        """
+        return self._metrics
 
-        return beta
+    def beta(self):
+        return self.compute_all().beta
 
-    def alpha(self):
-        try:
-            benchmark_returns = self.benchmark_instance.benchmark_average_return()
-            annual_benchmark_return = benchmark_returns[1]  # Get the annualized return
-
-            # Load portfolio data for ReturnsCalculator
-            portfolio_performance = ReturnsCalculator(self.df)
-
-            logger.debug(f"annual_benchmark_return: {annual_benchmark_return}")
-            beta_value = self.beta()
-            alpha = (
-                portfolio_performance.annualized_average_return() - self.RISK_FREE_RATE
-            ) - beta_value * (annual_benchmark_return - self.RISK_FREE_RATE)
-            return alpha
-        except Exception as e:
-            logger.exception(f"Could not calculate alpha: {e}")
+    def alpha(self, risk_free_rate=None):
+        """
+        Jensen's alpha, at the instance's risk-free rate unless one is given.
+
+        Other rates reuse the cached beta and annualized returns.
+        """
+        if risk_free_rate is None or risk_free_rate == self.RISK_FREE_RATE:
+            return self.compute_all().alpha
+        alphas = self._alpha_by_rate
+        if risk_free_rate not in alphas:
+            alphas[risk_free_rate] = self._alpha_impl(risk_free_rate)
+        return alphas[risk_free_rate]
+
+    @cached_property
+    def _alpha_by_rate(self) -> dict:
+        """Jensen's alpha per non-default risk-free rate, filled in by alpha()."""
+        return {}
+
+    def _alpha_impl(self, rf):
+        if not self._has_returns():
             return 0.0
+        return (self._portfolio_ann_return - rf) - self.beta() * (
+            self._annual_benchmark_return - rf
+        )
 
     def portfolio_risk_premium(self):
-        try:
-            # Load portfolio data for ReturnsCalculator
-            portfolio_performance = ReturnsCalculator(self.df)
-            return (
-                portfolio_performance.annualized_average_return() - self.RISK_FREE_RATE
-            )
-        except Exception as e:
-            logger.exception(f"Could not calculate portfolio risk premium: {e}")
-            return 0.0
+        return self.compute_all().risk_premium
 
     def treynor_ratio(self):
-        try:
-            return self.portfolio_risk_premium() / self.beta()
-        except Exception as e:
-            logger.exception(f"Could not calculate treynor ratio: {e}")
-            return 0.0
+        return self.compute_all().treynor
 
     def information_ratio(self):
-        try:
-            # Read portfolio returns
-            daily_portfolio_returns = self.df["pct_change"].dropna()
-            daily_benchmark_returns = self.benchmark_instance.benchmark_df[
-                "pct_change"
-            ].dropna()
-
-            # Align on dates to avoid NaNs due to mismatch
-            aligned = daily_portfolio_returns.align(
-                daily_benchmark_returns, join="inner"
-            )
-            daily_portfolio_returns, daily_benchmark_returns = aligned
-            if len(daily_portfolio_returns) == 0:
-                return 0.0, 0.0
-
-            # Excess returns and IR
-            excess_returns = daily_portfolio_returns - daily_benchmark_returns
-            daily_information_ratio = excess_returns.mean() / excess_returns.std()
-            annualized_information_ratio = daily_information_ratio * (252**0.5)
-            return daily_information_ratio, annualized_information_ratio
-        except Exception as e:
-            logger.exception(f"Could not calculate information ratio: {e}")
-            return 0.0, 0.0
+        metrics = self.compute_all()
+        return metrics.information_ratio_daily, metrics.information_ratio_annual
 
     def risk_adjusted_return(self):
-        try:
-            risk_metrics = RiskMetrics(self.df, self.RISK_FREE_RATE)
-            benchmark_vol = self.benchmark_instance.benchmark_volatility()[1]
-            portfolio_volatility = risk_metrics.annualized_volatility()
-            portfolio_risk_prem = self.portfolio_risk_premium()
-            risk_adjusted_return = (
-                portfolio_risk_prem * benchmark_vol / portfolio_volatility
-                + self.RISK_FREE_RATE
-            )
+        return self.compute_all().risk_adjusted_return
 
-            return risk_adjusted_return
-        except Exception as e:
-            logger.exception(f"Could not calculate risk adjusted return: {e}")
-            return 0.0
+    def alpha_vec(self, rfs) -> np.ndarray:
+        """
+        Alpha under several risk-free rate scenarios at once.
 
-    @lru_cache(maxsize=1)
-    def _get_monthly_returns_aligned_with_ff3(self):
+        Beta, the annualized portfolio return and the annualized benchmark return
+        are computed once and broadcast over rfs.
+
+        Args:
+            rfs: Array-like of annual risk-free rates (decimal)
+
+        Returns:
+            np.ndarray of alphas, one per rate
+        """
+        rfs = np.asarray(rfs, dtype=np.float64)
+        if not self._has_returns():
+            return np.zeros_like(rfs)
+        return (self._portfolio_ann_return - rfs) - self._metrics.beta * (
+            self._annual_benchmark_return - rfs
+        )
+
+    def risk_adjusted_return_vec(self, rfs) -> np.ndarray:
+        """
+        Risk-adjusted return under several risk-free rate scenarios at once.
+
+        Args:
+            rfs: Array-like of annual risk-free rates (decimal)
+
+        Returns:
+            np.ndarray of risk-adjusted returns, one per rate
+        """
+        rfs = np.asarray(rfs, dtype=np.float64)
+        if not self._has_returns():
+            return np.zeros_like(rfs)
+
+        portfolio_volatility = self._portfolio_ann_volatility
+        if not portfolio_volatility > 0:
+            return np.full_like(rfs, np.nan)
+        benchmark_vol = self.benchmark_instance.benchmark_volatility()[1]
+        return (
+            self._portfolio_ann_return - rfs
+        ) * benchmark_vol / portfolio_volatility + rfs
+
+    @staticmethod
+    def batch_beta(fund_returns: np.ndarray, benchmark: np.ndarray) -> np.ndarray:
+        """
+        Beta of many funds against one shared benchmark in a single vectorized pass.
+
+        Args:
+            fund_returns: (F, N) array of daily fund returns, already aligned to benchmark
+            benchmark: (N,) array of daily benchmark returns
+
+        Returns:
+            (F,) array of betas (NaN when the benchmark has no variance)
+        """
+        fund_returns = np.atleast_2d(np.asarray(fund_returns, dtype=np.float64))
+        benchmark = np.asarray(benchmark, dtype=np.float64)
+
+        bench_centered = benchmark - benchmark.mean()
+        bench_ss = bench_centered @ bench_centered
+        if not bench_ss > 0:
+            return np.full(fund_returns.shape[0], np.nan)
+        # The centred benchmark sums to zero, so the funds need no centring of
+        # their own (no (F, N) temporary); cov/var share the (N - 1) denominator
+        return (fund_returns @ bench_centered) / bench_ss
+
+    @staticmethod
+    def batch_alpha(
+        fund_returns: np.ndarray, benchmark: np.ndarray, risk_free_rate: float = 0.02
+    ) -> np.ndarray:
+        """
+        Jensen's alpha of many funds against one shared benchmark.
+
+        Uses the same annualization as alpha(): (1 + mean daily return) ** 252 - 1.
+
+        Args:
+            fund_returns: (F, N) array of daily fund returns, already aligned to benchmark
+            benchmark: (N,) array of daily benchmark returns
+            risk_free_rate: Annual risk-free rate (decimal)
+
+        Returns:
+            (F,) array of annualized alphas
+        """
+        fund_returns = np.atleast_2d(np.asarray(fund_returns, dtype=np.float64))
+        benchmark = np.asarray(benchmark, dtype=np.float64)
+
+        betas = MarketComparison.batch_beta(fund_returns, benchmark)
+        fund_annual_return = (1 + fund_returns.mean(axis=1)) ** 252 - 1
+        benchmark_annual_return = (1 + benchmark.mean()) ** 252 - 1
+        return (fund_annual_return - risk_free_rate) - betas * (
+            benchmark_annual_return - risk_free_rate
+        )
+
+    def _ff3_cache_path(self):
+        """
+        Parquet path for this portfolio's FF3 merge in the current month.
+
+        Keyed on a content hash of df and the factor data's month, so a rebuilt
+        portfolio or a new monthly factor release misses the cache. None when
+        parquet support (pyarrow) is unavailable or there is no data.
+        """
+        if not _HAS_PYARROW or self.df is None or self.df.empty:
+            return None
+        portfolio_hash = hashlib.md5(
+            pd.util.hash_pandas_object(self.df, index=False).to_numpy().tobytes()
+        ).hexdigest()
+        ff3_month = pd.Timestamp.today().to_period("M")
+        return os.path.join(self.cache_dir, f"ff3_{portfolio_hash}_{ff3_month}.parquet")
+
+    @cached_property
+    def _monthly_returns_aligned_with_ff3(self):
+        """
+        Monthly portfolio returns aligned with FF3 factors, read through a disk cache.
+
+        Returns:
+            DataFrame with columns: Date, portfolio_return, Mkt-RF, SMB, HML, RF
+        """
+        cache_path = self._ff3_cache_path()
+        if cache_path is not None and os.path.exists(cache_path):
+            try:
+                return pd.read_parquet(cache_path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable FF3 cache {cache_path}: {e}")
+
+        merged_df = self._build_monthly_returns_aligned_with_ff3()
+        if cache_path is not None and not merged_df.empty:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                merged_df.to_parquet(cache_path, index=False)
+                # Older merges (earlier builds or months) are never read again
+                _remove_stale_ff3_files(self.cache_dir, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write FF3 cache {cache_path}: {e}")
+        return merged_df
+
+    def _build_monthly_returns_aligned_with_ff3(self):
         """
         Helper method to convert daily portfolio data to monthly returns
         and align with Fama-French 3-factor data.
@@ -147,6 +552,10 @@ class MarketComparison:
         Returns:
             DataFrame with columns: Date, portfolio_return, Mkt-RF, SMB, HML, RF
         """
+        # No portfolio history yet (new fund): skip the factor download entirely
+        if self.df is None or self.df.empty:
+            return pd.DataFrame()
+
         try:
             # Get Fama-French 3-factor monthly data
             ff3_df = gff.famaFrench3Factor(frequency="m")
@@ -155,21 +564,30 @@ class MarketComparison:
             ff3_df["Date"] = pd.to_datetime(ff3_df["Date"])
 
             # Convert daily portfolio data to monthly
-            portfolio_df = self.df.copy()
-            if "Date" not in portfolio_df.columns:
-                portfolio_df.reset_index(inplace=True)
-
-            portfolio_df["Date"] = pd.to_datetime(portfolio_df["Date"])
-            portfolio_df.set_index("Date", inplace=True)
-
-            # Resample to month-end and calculate monthly returns
             # Use the portfolio value column (adjust based on your column name)
             value_col = (
                 "Total_Portfolio_Value"
-                if "Total_Portfolio_Value" in portfolio_df.columns
+                if "Total_Portfolio_Value" in self.df.columns
                 else "Total Mkt Val"
             )
-            monthly_values = portfolio_df[value_col].resample("ME").last()
+            # Only the value column and the dates are needed: read them as arrays
+            # instead of copying df or building a date-indexed Series
+            dates = pd.DatetimeIndex(
+                self.df["Date"] if "Date" in self.df.columns else self.df.index
+            ).to_numpy()
+            valid = ~np.isnat(dates)
+            portfolio_values = pd.Series(self.df[value_col].to_numpy()[valid])
+
+            # Last value per month via a hash groupby on monthly period ordinals
+            # (months since 1970-01, read straight off the datetime64 buffer),
+            # which skips the empty bins resample builds
+            month_codes = dates[valid].astype("datetime64[M]").astype(np.int64)
+            monthly_values = portfolio_values.groupby(month_codes).last()
+            monthly_values.index = (
+                pd.PeriodIndex.from_ordinals(monthly_values.index, freq="M")
+                .to_timestamp(how="end")
+                .normalize()
+            )
             monthly_returns = monthly_values.pct_change().dropna()
 
             # Create DataFrame with monthly returns
@@ -199,14 +617,28 @@ class MarketComparison:
             if pd.notna(max_abs_factor) and max_abs_factor > 1:
                 merged_df[factor_cols] = merged_df[factor_cols] / 100.0
 
-            logger.debug(f"Aligned {len(merged_df)} months of data for FF3 analysis")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Aligned {len(merged_df)} months of data for FF3 analysis"
+                )
             return merged_df
 
-        except Exception as e:
-            logger.exception(f"Could not align monthly returns with FF3 factors: {e}")
+        # Download (OSError), factor-file parsing (ValueError, IndexError) and
+        # missing-column (KeyError) failures; anything else is a bug and propagates
+        except (OSError, KeyError, IndexError, ValueError) as e:
+            # The traceback is only worth formatting when debugging
+            logger.warning(
+                f"Could not align monthly returns with FF3 factors: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return pd.DataFrame()
 
-    @lru_cache(maxsize=1)
+    @cached_property
+    def _ff3_arrays(self) -> FF3Arrays:
+        """The cached monthly merge as FF3Arrays, shared by every FF3 fit."""
+        return FF3Arrays.from_frame(self._monthly_returns_aligned_with_ff3)
+
+    @cached_property
     def _ff3_regression_results(self):
         """
         Fit the canonical Fama-French 3-factor regression:
@@ -217,50 +649,75 @@ class MarketComparison:
                 market_factor, size_factor, value_factor, alpha, r_squared, observations
             or {} when data is insufficient.
         """
-        try:
-            merged_df = self._get_monthly_returns_aligned_with_ff3()
-            if merged_df.empty:
-                return {}
-
-            min_observations = 12
-            if len(merged_df) < min_observations:
-                logger.warning(
-                    f"Insufficient data for FF3 regression: {len(merged_df)} observations "
-                    f"(need at least {min_observations})"
-                )
-                return {}
-
-            y = (merged_df["portfolio_return"] - merged_df["RF"]).to_numpy(dtype=float)
-            x_factors = merged_df[["Mkt-RF", "SMB", "HML"]].to_numpy(dtype=float)
-            x = np.column_stack(
-                [np.ones(len(x_factors)), x_factors]
-            )  # intercept + 3 factors
-
-            # OLS coefficients via least squares
-            coefs, _, _, _ = np.linalg.lstsq(x, y, rcond=None)
-            alpha, beta_mkt, beta_smb, beta_hml = coefs
-
-            y_hat = x @ coefs
-            residuals = y - y_hat
-            ss_res = float(np.sum(residuals**2))
-            ss_tot = float(np.sum((y - y.mean()) ** 2))
-            r_squared = 1.0 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
-
-            return {
-                "market_factor": float(beta_mkt),
-                "size_factor": float(beta_smb),
-                "value_factor": float(beta_hml),
-                "alpha": float(alpha),  # monthly alpha (decimal)
-                "r_squared": float(r_squared),
-                "observations": int(len(merged_df)),
-            }
-        except Exception as e:
-            logger.exception(f"Could not fit FF3 regression: {e}")
+        arrays = self._ff3_arrays
+        if arrays.n == 0:
+            return {}
+
+        min_observations = 12
+        if arrays.n < min_observations:
+            logger.warning(
+                f"Insufficient data for FF3 regression: {arrays.n} observations "
+                f"(need at least {min_observations})"
+            )
             return {}
 
+        results = _ff3_fit(arrays.matrix)
+        results["observations"] = int(arrays.n)
+        return results
+
     def fama_french_3factor_regression(self):
         """Public wrapper returning FF3 regression outputs."""
-        return self._ff3_regression_results()
+        # Copy so callers cannot modify the cached result in place
+        return dict(self._ff3_regression_results)
+
+    def rolling_ff3(self, windows=(12, 36, 60)) -> pd.DataFrame:
+        """
+        FF3 regression over the trailing N months for each window length.
+
+        All windows are fitted from one factor matrix built off the cached
+        monthly merge. Windows longer than the available history get NaN rows.
+
+        Returns:
+            DataFrame indexed by window with columns market_factor, size_factor,
+            value_factor, alpha, r_squared, observations
+        """
+        columns = [
+            "market_factor",
+            "size_factor",
+            "value_factor",
+            "alpha",
+            "r_squared",
+            "observations",
+        ]
+        m = self._ff3_arrays.matrix
+
+        rows = []
+        for window in windows:
+            if window < 12 or window > len(m):
+                rows.append(dict.fromkeys(columns, np.nan))
+                continue
+            fit = _ff3_fit(m[-window:])
+            fit["observations"] = int(window)
+            rows.append(fit)
+        return pd.DataFrame(
+            rows, index=pd.Index(windows, name="window"), columns=columns
+        )
+
+    def ff3_betas(self) -> dict:
+        """
+        All three FF3 factor loadings from the single cached regression.
+
+        Returns:
+            dict with keys market, smb, hml, or {} when data is insufficient
+        """
+        results = self._ff3_regression_results
+        if not results:
+            return {}
+        return {
+            "market": results["market_factor"],
+            "smb": results["size_factor"],
+            "hml": results["value_factor"],
+        }
 
     def market_factor(self):
         """
@@ -274,13 +731,7 @@ class MarketComparison:
                   < 1.0 = Less volatile than market
                   = 1.0 = Moves with market
         """
-        try:
-            results = self._ff3_regression_results()
-            return float(results.get("market_factor", 0.0))
-
-        except Exception as e:
-            logger.exception(f"Could not calculate market factor: {e}")
-            return 0.0
+        return float(self.ff3_betas().get("market", 0.0))
 
     def size_factor(self):
         """
@@ -294,13 +745,7 @@ class MarketComparison:
                   < 0 = Large-cap tilt (outperforms when large caps beat small caps)
                   ≈ 0 = Neutral to size
         """
-        try:
-            results = self._ff3_regression_results()
-            return float(results.get("size_factor", 0.0))
-
-        except Exception as e:
-            logger.exception(f"Could not calculate size factor: {e}")
-            return 0.0
+        return float(self.ff3_betas().get("smb", 0.0))
 
     def value_factor(self):
         """
@@ -314,10 +759,4 @@ class MarketComparison:
                   < 0 = Growth tilt (outperforms when growth beats value)
                   ≈ 0 = Neutral to value/growth
         """
-        try:
-            results = self._ff3_regression_results()
-            return float(results.get("value_factor", 0.0))
-
-        except Exception as e:
-            logger.exception(f"Could not calculate value factor: {e}")
-            return 0.0
+        return float(self.ff3_betas().get("hml", 0.0))
@@ -9,22 +9,16 @@ This controller handles all portfolio operations including:
 """
 
 import os
-import sys
+import time
+import numpy as np
 import pandas as pd
-import yaml
-import yfinance as yf
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import performance modules
 from .returns_calculator import ReturnsCalculator
-from .risk_metrics import RiskMetrics
-from .market_comparison import MarketComparison
 from .benchmark import Benchmark
-from .data_service import DataService
+from .data_service import _HAS_PYARROW, DataService, read_csv
 
 # Import logging
 from ..config.logging_config import get_logger
@@ -32,6 +26,98 @@ from ..config.logging_config import get_logger
 # Set up logger for this module
 logger = get_logger(__name__)
 
+# Summary/performance results shared across controller instances (the app builds
+# new controllers on every rerun). Keys include the data snapshot, so rebuilt
+# outputs miss; the TTL bounds how long a fetched risk-free rate is reused, and
+# expired entries are evicted whenever a new result is stored.
+_RESULT_TTL_SECONDS = 60.0
+_RESULT_CACHE: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+
+# Background ^IRX lookups for _build_performance_metrics, one at a time
+_RATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="irx")
+
+# SPY closes for the cumulative returns chart, keyed on (start, end) and kept in
+# memory and as parquet under <data>/.cache/spy for a day before re-downloading;
+# only the newest end date is kept for each start date
+_SPY_TTL_SECONDS = 24 * 60 * 60
+_SPY_CACHE: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+
+
+def _load_spy_close(
+    start_date: pd.Timestamp, end_date: pd.Timestamp, cache_dir: str
+) -> pd.DataFrame:
+    """SPY daily closes between two dates as a date-sorted (Date, Close) frame."""
+    key = (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+    hit = _SPY_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _SPY_TTL_SECONDS:
+        return hit[1]
+
+    cache_path = os.path.join(cache_dir, f"spy_{key[0]}_{key[1]}.parquet")
+    spy_data = None
+    if _HAS_PYARROW:
+        try:
+            if time.time() - os.stat(cache_path).st_mtime < _SPY_TTL_SECONDS:
+                spy_data = pd.read_parquet(cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable SPY cache {cache_path}: {e}")
+
+    if spy_data is None:
+        import yfinance as yf
+
+        history = yf.Ticker("SPY").history(start=start_date, end=end_date)
+        if history.empty:
+            # Not cached, so the next call retries the download
+            return pd.DataFrame(columns=["Date", "Close"])
+        # Date column from the index, made timezone naive
+        spy_data = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(history.index).tz_localize(None),
+                "Close": history["Close"].to_numpy(),
+            }
+        ).sort_values("Date", ignore_index=True)
+        if _HAS_PYARROW:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                spy_data.to_parquet(cache_path, index=False)
+                _remove_stale_spy_files(cache_dir, key[0], cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write SPY cache {cache_path}: {e}")
+
+    # The end date moves daily: keep only the newest range per start date and
+    # drop expired ranges so the in-memory cache does not grow without bound
+    now = time.monotonic()
+    for stale, (stamp, _) in list(_SPY_CACHE.items()):
+        if stale[0] == key[0] or now - stamp >= _SPY_TTL_SECONDS:
+            _SPY_CACHE.pop(stale, None)
+    _SPY_CACHE[key] = (now, spy_data)
+    return spy_data
+
+
+def _remove_stale_spy_files(cache_dir: str, start: str, keep_path: str) -> None:
+    """Delete older SPY parquet files for the same start date than keep_path."""
+    prefix = f"spy_{start}_"
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith(prefix)
+                and entry.name.endswith(".parquet")
+                and entry.path != keep_path
+            ):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def _coerce_date(d) -> Optional[pd.Timestamp]:
+    """Parse a scalar date (str, datetime or Timestamp) once into a tz-naive Timestamp."""
+    if d is None or (isinstance(d, str) and not d):
+        return None
+    ts = d if isinstance(d, pd.Timestamp) else pd.Timestamp(d)
+    return ts.tz_localize(None) if ts.tz is not None else ts
+
 
 class PortfolioController:
     """Main controller for portfolio operations"""
@@ -45,12 +131,35 @@ class PortfolioController:
         # Initialize data service
         self._data_service = DataService(portfolio_name, data_directory)
 
-        # Initialize performance calculators
-        self._risk_metrics = None  # Will build per-request with actual df
-        self._market_comparison = (
-            None  # Construct per-request with current portfolio df
+        # Per-portfolio FF3 merge cache, next to the SPY cache under <data>/.cache
+        self._ff3_cache_dir = os.path.join(
+            data_directory, ".cache", "ff3", portfolio_name
         )
-        self._benchmark = Benchmark()
+
+        # portfolio_total.csv frame shared by every calculator, loaded on first use
+        self._portfolio_df_cache: Optional[pd.DataFrame] = None
+
+    @property
+    def _portfolio_df(self) -> pd.DataFrame:
+        """Portfolio totals frame, loaded once and reused until clear_cache()"""
+        if self._portfolio_df_cache is None:
+            self._portfolio_df_cache = self._data_service.get_portfolio_total_data()
+        return self._portfolio_df_cache
+
+    def _cached_result(self, key: tuple, compute) -> Dict[str, Any]:
+        """Return compute() through the shared TTL result cache"""
+        key = (self.data_directory, self.portfolio_name) + key
+        now = time.monotonic()
+        hit = _RESULT_CACHE.get(key)
+        if hit is None or now - hit[0] >= _RESULT_TTL_SECONDS:
+            # Evict expired entries on insert: keys carry the date, rate and data
+            # snapshot, so old ones would otherwise never be requested again
+            for stale, (stamp, _) in list(_RESULT_CACHE.items()):
+                if now - stamp >= _RESULT_TTL_SECONDS:
+                    _RESULT_CACHE.pop(stale, None)
+            hit = _RESULT_CACHE[key] = (now, compute())
+        # Shallow copy so callers cannot edit the cached dict in place
+        return dict(hit[1])
 
     def _get_risk_free_rate(self) -> tuple[float, str]:
         """Resolve the risk-free rate for ratio calculations.
@@ -59,6 +168,8 @@ class PortfolioController:
         """
         # Try 3-month T-Bill yield from Yahoo Finance
         try:
+            import yfinance as yf
+
             ticker = yf.Ticker("^IRX")
             hist = ticker.history(period="5d")
             if not hist.empty and "Close" in hist.columns:
@@ -74,6 +185,8 @@ class PortfolioController:
                 os.path.dirname(__file__), "..", "..", "config", "config.yaml"
             )
             if os.path.exists(config_path):
+                import yaml
+
                 with open(config_path, "r", encoding="utf-8") as f:
                     config = yaml.safe_load(f) or {}
                 rate = config.get("risk_free_rate")
@@ -85,17 +198,24 @@ class PortfolioController:
 
     def get_available_portfolios(self) -> List[str]:
         """Get list of available portfolios"""
-        if not os.path.exists(self.data_directory):
+        # scandir entries carry their type, so no per-folder stat is needed
+        try:
+            with os.scandir(self.data_directory) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
             return []
 
-        return [
-            folder
-            for folder in os.listdir(self.data_directory)
-            if os.path.isdir(os.path.join(self.data_directory, folder))
-        ]
-
     def get_portfolio_summary(self, as_of_date: str = None) -> Dict[str, Any]:
         """Get portfolio summary data"""
+        as_of_date = _coerce_date(as_of_date)
+        key = ("summary", as_of_date, self._data_service.cache_version)
+        return self._cached_result(
+            key, lambda: self._build_portfolio_summary(as_of_date)
+        )
+
+    def _build_portfolio_summary(
+        self, as_of_date: Optional[pd.Timestamp] = None
+    ) -> Dict[str, Any]:
         try:
             holdings_df = self._data_service.get_holdings_data()
             if holdings_df.empty:
@@ -108,37 +228,35 @@ class PortfolioController:
             )
 
         # Use authoritative totals from portfolio_total.csv
-        totals_df = self._data_service.get_portfolio_total_data()
-        if as_of_date:
-            as_of_dt = pd.to_datetime(as_of_date)
-        else:
-            as_of_dt = (
-                totals_df["Date"].max()
-                if not totals_df.empty
-                else pd.to_datetime(datetime.now())
-            )
-        row = totals_df[totals_df["Date"] == as_of_dt]
-        if row.empty and not totals_df.empty:
-            # closest previous date
-            as_of_dt = totals_df["Date"].max()
-            row = totals_df[totals_df["Date"] == as_of_dt]
+        totals_df = self._portfolio_df
+        # Exact date when present, otherwise the latest available row
+        as_of_dt, row = self._data_service.get_portfolio_total_row(
+            as_of_date, totals_df
+        )
+        if as_of_dt is None:
+            as_of_dt = as_of_date if as_of_date is not None else pd.Timestamp.now()
         # Use concrete columns emitted by the builder
-        if not row.empty:
-            total_holdings_value = float(row.iloc[0]["Total_Holdings_CAD"])
-            total_portfolio_value = float(row.iloc[0]["Total_Portfolio_Value"])
-            total_cash_cad = float(row.iloc[0]["Total_Cash_CAD"])
-            cad_holdings_mv = float(row.iloc[0]["CAD_Holdings_MV"])
-            usd_holdings_mv = float(row.iloc[0]["USD_Holdings_MV"])
-            cad_cash = float(row.iloc[0]["CAD_Cash"])
-            usd_cash = float(row.iloc[0]["USD_Cash"])
+        if row is not None:
+            # One dict conversion instead of a Series label lookup per field
+            rec = row.to_dict()
+            total_holdings_value = float(rec["Total_Holdings_CAD"])
+            total_portfolio_value = float(rec["Total_Portfolio_Value"])
+            total_cash_cad = float(rec["Total_Cash_CAD"])
+            cad_holdings_mv = float(rec["CAD_Holdings_MV"])
+            usd_holdings_mv = float(rec["USD_Holdings_MV"])
+            cad_cash = float(rec["CAD_Cash"])
+            usd_cash = float(rec["USD_Cash"])
         else:
             logger.warning(
                 f"No portfolio total data found for {as_of_date}. Using latest available data."
             )
-            total_holdings_value = float(holdings_df["market_value"].sum())
+            # nansum keeps pandas' skip-NaN semantics for unpriced holdings
+            total_holdings_value = float(
+                np.nansum(holdings_df["market_value"].to_numpy(dtype=np.float64))
+            )
             total_portfolio_value = total_holdings_value
             total_cash_cad = 0.0
-            cad_holdings_mv = float(holdings_df["market_value"].sum())
+            cad_holdings_mv = total_holdings_value
             usd_holdings_mv = 0.0
             cad_cash = 0.0
             usd_cash = 0.0
@@ -147,12 +265,7 @@ class PortfolioController:
 
         # Cumulative return since inception (%)
         try:
-            returns_series_df = ReturnsCalculator(totals_df).cumulative_return_series()
-            inception_return_pct = (
-                float(returns_series_df["Cumulative_Return_Pct"].iloc[-1])
-                if not returns_series_df.empty
-                else None
-            )
+            inception_return_pct = ReturnsCalculator(totals_df).inception_return_pct()
         except Exception as e:
             logger.warning(f"Could not compute inception cumulative return: {e}")
             inception_return_pct = None
@@ -189,21 +302,12 @@ class PortfolioController:
     def get_holdings_data(self, as_of_date: str = None) -> pd.DataFrame:
         """Get holdings data as DataFrame"""
         holdings_df = self._data_service.get_holdings_data()
-        portfolio_total_df = self._data_service.get_portfolio_total_data()
+        portfolio_total_df = self._portfolio_df
 
-        # Calculate weights
         if portfolio_total_df.empty:
             raise ValueError(
                 "portfolio_total.csv is empty or missing required data (Total_Holdings_CAD)."
             )
-        # Use latest (or selected) Total_Holdings_CAD
-        if as_of_date is not None:
-            as_of_dt = pd.to_datetime(as_of_date)
-            row = portfolio_total_df.loc[portfolio_total_df["Date"] == as_of_dt]
-            if row.empty:
-                row = portfolio_total_df.sort_values("Date").iloc[[-1]]
-        else:
-            row = portfolio_total_df.sort_values("Date").iloc[[-1]]
 
         return holdings_df
 
@@ -213,92 +317,110 @@ class PortfolioController:
         """Get comprehensive performance metrics.
         risk_free_rate: If None, uses 3-month T-Bill (^IRX) via yfinance, then config fallback.
         """
+        date = _coerce_date(date)
+        key = (
+            "performance",
+            date,
+            risk_free_rate,
+            self._data_service.cache_version,
+            Benchmark._snapshot_mtime(),
+        )
+        return self._cached_result(
+            key, lambda: self._build_performance_metrics(date, risk_free_rate)
+        )
+
+    def _build_performance_metrics(
+        self,
+        date: Optional[pd.Timestamp] = None,
+        risk_free_rate: Optional[float] = None,
+    ) -> Dict[str, Any]:
         risk_free_rate_source: Optional[str] = None
-        if risk_free_rate is None:
-            risk_free_rate, risk_free_rate_source = self._get_risk_free_rate()
-        portfolio_total_df = self._data_service.get_portfolio_total_data()
+        portfolio_total_df = self._portfolio_df
 
         if portfolio_total_df.empty:
             raise FileNotFoundError(
                 f"Portfolio total data not found for {self.portfolio_name}"
             )
 
-        if date is None:
-            date = portfolio_total_df["Date"].max()
-        else:
-            date = pd.to_datetime(date)
+        rate_future = None
+        if risk_free_rate is None:
+            # The ^IRX lookup is a network round trip; resolve it in the background
+            # while the rate-independent period returns are computed.
+            rate_future = _RATE_EXECUTOR.submit(self._get_risk_free_rate)
+        try:
+            # DataService returns the totals sorted by Date, so the last row is
+            # the latest
+            latest_date = portfolio_total_df["Date"].iat[-1]
+            if date is None:
+                date = latest_date
 
-        # Calculate returns for different periods
-        returns_calc = ReturnsCalculator(portfolio_total_df, date)
-        if not returns_calc.valid_date():
-            logger.warning(
-                f"Date {date} not available in data, using latest available date"
-            )
-            date = portfolio_total_df["Date"].max()
+            # Calculate returns for different periods
             returns_calc = ReturnsCalculator(portfolio_total_df, date)
+            if not returns_calc.valid_date():
+                logger.warning(
+                    f"Date {date} not available in data, using latest available date"
+                )
+                # Same frame, so keep the calculator (and its date-sorted arrays)
+                date = latest_date
+                returns_calc.date = date
+
+            performance = returns_calc.calculate_performance()
 
-        performance = returns_calc.calculate_performance()
+            if rate_future is not None:
+                risk_free_rate, risk_free_rate_source = rate_future.result()
+        finally:
+            # No-op once the lookup has finished; drops it if still queued
+            if rate_future is not None:
+                rate_future.cancel()
 
+        # Imported on first use: compiling the risk kernel loads numba
+        from .risk_metrics import RiskMetrics
+
+        # One fused pass over the returns yields every risk metric and ratio
+        all_risk = RiskMetrics(portfolio_total_df, risk_free_rate).compute_all()
         risk_metrics = {
-            "daily_volatility": RiskMetrics(portfolio_total_df).daily_volatility(),
-            "annualized_volatility": RiskMetrics(
-                portfolio_total_df
-            ).annualized_volatility(),
-            "maximum_drawdown": RiskMetrics(portfolio_total_df).maximum_drawdown(),
-            "daily_downside_volatility": RiskMetrics(
-                portfolio_total_df
-            ).daily_downside_volatility(),
-            "annualized_downside_volatility": RiskMetrics(
-                portfolio_total_df
-            ).annualized_downside_volatility(),
+            key: all_risk[key]
+            for key in (
+                "daily_volatility",
+                "annualized_volatility",
+                "maximum_drawdown",
+                "daily_downside_volatility",
+                "annualized_downside_volatility",
+            )
         }
 
-        # Add ratios - use in-memory portfolio data
+        # Imported on first use: it pulls in the Fama-French factor client
+        from .market_comparison import MarketComparison
+
+        # One MarketComparison and one compute_all() pass serve both the
+        # information ratio and beta/alpha/premium - use in-memory portfolio data
         try:
-            risk_metrics_inst = RiskMetrics(portfolio_total_df)
-            daily_sharpe, annualized_sharpe = risk_metrics_inst.sharpe_ratio(
-                risk_free_rate
-            )
-            daily_sortino, annualized_sortino = risk_metrics_inst.sortino_ratio(
-                risk_free_rate
-            )
-            market_comp = MarketComparison(
-                portfolio_total_df, useSpy=False, risk_free_rate=risk_free_rate
-            )
-            daily_info, annualized_info = market_comp.information_ratio()
+            market = MarketComparison(
+                portfolio_total_df,
+                useSpy=False,
+                risk_free_rate=risk_free_rate,
+                cache_dir=self._ff3_cache_dir,
+            ).compute_all()
+        except Exception as e:
+            logger.exception(f"Could not calculate market comparison metrics: {e}")
+            market = None
 
+        if market is not None:
             ratios = {
-                "daily_sharpe_ratio": daily_sharpe,
-                "annualized_sharpe_ratio": annualized_sharpe,
-                "daily_sortino_ratio": daily_sortino,
-                "annualized_sortino_ratio": annualized_sortino,
-                "daily_information_ratio": daily_info,
-                "annualized_information_ratio": annualized_info,
+                "daily_sharpe_ratio": all_risk["daily_sharpe_ratio"],
+                "annualized_sharpe_ratio": all_risk["annualized_sharpe_ratio"],
+                "daily_sortino_ratio": all_risk["daily_sortino_ratio"],
+                "annualized_sortino_ratio": all_risk["annualized_sortino_ratio"],
+                "daily_information_ratio": market.information_ratio_daily,
+                "annualized_information_ratio": market.information_ratio_annual,
             }
-        except Exception as e:
-            logger.exception(f"Could not calculate ratios: {e}")
-            ratios = {}
-
-        # Add market comparison metrics - use in-memory portfolio data
-        try:
-            market_comp = (
-                market_comp
-                if "market_comp" in locals()
-                else MarketComparison(
-                    portfolio_total_df, useSpy=False, risk_free_rate=risk_free_rate
-                )
-            )
-            beta = market_comp.beta()
-            alpha = market_comp.alpha()
-            risk_premium = market_comp.portfolio_risk_premium()
-
             market_metrics = {
-                "beta": beta,
-                "alpha": alpha,
-                "risk_premium": risk_premium,
+                "beta": market.beta,
+                "alpha": market.alpha,
+                "risk_premium": market.risk_premium,
             }
-        except Exception as e:
-            logger.exception(f"Could not calculate market metrics: {e}")
+        else:
+            ratios = {}
             market_metrics = {}
 
         return {
@@ -317,27 +439,20 @@ class PortfolioController:
 
     def get_total_portfolio_value(self, as_of_date: str = None) -> float:
         """Get total portfolio value (including cash) for a specific date"""
-        portfolio_total_df = self._data_service.get_portfolio_total_data()
-
-        if portfolio_total_df.empty:
+        # Exact date when present, otherwise the latest available row; read the
+        # one cell instead of materializing the whole row
+        totals_df = self._portfolio_df
+        pos = self._data_service.get_portfolio_total_position(
+            _coerce_date(as_of_date), totals_df
+        )
+        if pos is None:
             return 0.0
 
-        if as_of_date is None:
-            as_of_date = portfolio_total_df["Date"].max()
-        else:
-            as_of_date = pd.to_datetime(as_of_date)
-
-        # Get data for the specific date
-        portfolio_data = portfolio_total_df[portfolio_total_df["Date"] == as_of_date]
-        if len(portfolio_data) == 0:
-            # Use latest available data
-            portfolio_data = portfolio_total_df.iloc[-1:]
-
-        return portfolio_data.iloc[0]["Total_Portfolio_Value"]
+        return totals_df["Total_Portfolio_Value"].iat[pos]
 
     def get_portfolio_total_data(self) -> pd.DataFrame:
         """Get portfolio total data DataFrame"""
-        return self._data_service.get_portfolio_total_data()
+        return self._portfolio_df
 
     def get_dividend_data(self) -> pd.DataFrame:
         """Get dividend data DataFrame"""
@@ -345,6 +460,13 @@ class PortfolioController:
 
     def clear_cache(self):
         """Clear data cache"""
+        self._portfolio_df_cache = None
+        for key in [
+            k
+            for k in _RESULT_CACHE
+            if k[:2] == (self.data_directory, self.portfolio_name)
+        ]:
+            del _RESULT_CACHE[key]
         self._data_service.clear_cache()
 
     def get_cache_info(self) -> Dict[str, Any]:
@@ -353,7 +475,7 @@ class PortfolioController:
 
     def get_cumulative_returns(self) -> pd.DataFrame:
         """Get cumulative return since inception as a percentage series (Date, Cumulative_Return_Pct)."""
-        portfolio_total_df = self._data_service.get_portfolio_total_data()
+        portfolio_total_df = self._portfolio_df
         if portfolio_total_df.empty:
             return pd.DataFrame(
                 columns=[
@@ -365,6 +487,8 @@ class PortfolioController:
 
         calc = ReturnsCalculator(portfolio_total_df)
         portfolio_returns = calc.cumulative_return_series()
+        # Benchmark and SPY series are aligned onto these dates by index lookup
+        portfolio_dates = pd.DatetimeIndex(portfolio_returns["Date"])
 
         # Get Benchmark Returns
         try:
@@ -373,32 +497,35 @@ class PortfolioController:
                 self.data_directory, "benchmark", "output", "portfolio_total.csv"
             )
             if os.path.exists(benchmark_path):
-                bench_df = pd.read_csv(benchmark_path)
+                # Parsed once per file version (Date included), then memoized
+                bench_df = read_csv(benchmark_path)
                 if (
                     not bench_df.empty
                     and "Date" in bench_df.columns
                     and "Total_Portfolio_Value" in bench_df.columns
                 ):
-                    bench_df["Date"] = pd.to_datetime(bench_df["Date"])
-
-                    # Filter benchmark to match portfolio date range
+                    # Filter benchmark to match portfolio date range, keeping
+                    # only the two columns used below
                     start_date = portfolio_returns["Date"].min()
-                    bench_df = bench_df[bench_df["Date"] >= start_date].copy()
-                    bench_df = bench_df.sort_values("Date")
+                    bench_df = bench_df.loc[
+                        bench_df["Date"] >= start_date,
+                        ["Date", "Total_Portfolio_Value"],
+                    ]
+                    if not bench_df["Date"].is_monotonic_increasing:
+                        bench_df = bench_df.sort_values("Date")
 
                     if not bench_df.empty:
-                        start_val = bench_df["Total_Portfolio_Value"].iloc[0]
+                        bench_values = bench_df["Total_Portfolio_Value"].to_numpy()
+                        start_val = bench_values[0]
                         if start_val > 0:
-                            bench_df["Benchmark_Cumulative_Return_Pct"] = (
-                                bench_df["Total_Portfolio_Value"] / start_val - 1.0
-                            ) * 100.0
-
-                            # Merge with portfolio returns
-                            portfolio_returns = pd.merge(
-                                portfolio_returns,
-                                bench_df[["Date", "Benchmark_Cumulative_Return_Pct"]],
-                                on="Date",
-                                how="left",
+                            bench_pct = pd.Series(
+                                (bench_values / start_val - 1.0) * 100.0,
+                                index=pd.DatetimeIndex(bench_df["Date"]),
+                            )
+
+                            # Align with portfolio returns
+                            portfolio_returns["Benchmark_Cumulative_Return_Pct"] = (
+                                bench_pct.reindex(portfolio_dates).to_numpy()
                             )
         except Exception as e:
             logger.warning(f"Could not load benchmark data: {e}")
@@ -408,31 +535,29 @@ class PortfolioController:
             start_date = portfolio_returns["Date"].min()
             end_date = portfolio_returns["Date"].max() + pd.Timedelta(days=1)
 
-            # Download SPY data
-            spy_data = yf.Ticker("SPY").history(start=start_date, end=end_date)
+            # Download SPY data (cached per date range for a day)
+            spy_data = _load_spy_close(
+                start_date,
+                end_date,
+                os.path.join(self.data_directory, ".cache", "spy"),
+            )
 
             if not spy_data.empty:
-                # Reset index to get Date column and ensure timezone naive
-                spy_data = spy_data.reset_index()
-                spy_data["Date"] = pd.to_datetime(spy_data["Date"]).dt.tz_localize(None)
-                spy_data = spy_data.sort_values("Date")
-
                 # Filter to ensure we align with portfolio dates
                 spy_data = spy_data[spy_data["Date"] >= start_date]
 
                 if not spy_data.empty:
-                    start_price = spy_data["Close"].iloc[0]
+                    close = spy_data["Close"].to_numpy()
+                    start_price = close[0]
                     if start_price > 0:
-                        spy_data["SPY_Cumulative_Return_Pct"] = (
-                            spy_data["Close"] / start_price - 1.0
-                        ) * 100.0
-
-                        # Merge with portfolio returns
-                        portfolio_returns = pd.merge(
-                            portfolio_returns,
-                            spy_data[["Date", "SPY_Cumulative_Return_Pct"]],
-                            on="Date",
-                            how="left",
+                        spy_pct = pd.Series(
+                            (close / start_price - 1.0) * 100.0,
+                            index=pd.DatetimeIndex(spy_data["Date"]),
+                        )
+
+                        # Align with portfolio returns
+                        portfolio_returns["SPY_Cumulative_Return_Pct"] = (
+                            spy_pct.reindex(portfolio_dates).to_numpy()
                         )
         except Exception as e:
             logger.warning(f"Could not load SPY data: {e}")
@@ -456,21 +581,25 @@ class PortfolioController:
             - observations: Number of monthly observations used
         """
         try:
-            portfolio_total_df = self._data_service.get_portfolio_total_data()
+            portfolio_total_df = self._portfolio_df
 
             if portfolio_total_df.empty:
                 logger.warning("No portfolio data available for Fama-French analysis")
                 return {}
 
             # Filter data up to as_of_date if provided
-            if as_of_date:
-                as_of_dt = pd.to_datetime(as_of_date)
+            as_of_dt = _coerce_date(as_of_date)
+            if as_of_dt is not None:
                 portfolio_total_df = portfolio_total_df[
                     portfolio_total_df["Date"] <= as_of_dt
                 ]
 
             # Initialize market comparison with portfolio data
-            market_comp = MarketComparison(portfolio_total_df, useSpy=True)
+            from .market_comparison import MarketComparison
+
+            market_comp = MarketComparison(
+                portfolio_total_df, useSpy=True, cache_dir=self._ff3_cache_dir
+            )
 
             result = market_comp.fama_french_3factor_regression()
             if not result:
@@ -10,8 +10,15 @@ It handles:
 The module is designed to work with either a DataFrame or CSV file input.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import timedelta
+from functools import cached_property
+
+# calculate_performance periods, in output order; QTD and YTD snap forward to the
+# first trading day on/after their start, the others back to the last one before
+_PERIODS = ("one_day", "one_week", "one_month", "qtd", "ytd", "one_year", "inception")
+_SNAP_FORWARD = np.array([key in ("ytd", "qtd") for key in _PERIODS])
 
 
 class ReturnsCalculator:
@@ -23,50 +30,122 @@ class ReturnsCalculator:
         self.portfolio_column = portfolio_column
 
     def valid_date(self):
-        return self.date in self.df["Date"].values
-
-    def _closest_date(self, target_date, side="left"):
-        target_date = pd.to_datetime(target_date)
-        valid_dates = (
-            self.df[self.df["Date"] <= target_date]["Date"]
-            if side == "left"
-            else self.df[self.df["Date"] >= target_date]["Date"]
-        )
-        return valid_dates.max() if side == "left" else valid_dates.min()
+        return self._date_position(self.date) is not None
+
+    @cached_property
+    def _sorted(self) -> tuple[np.ndarray, np.ndarray]:
+        """(dates, values) as arrays in date order; ties keep their row order."""
+        dates = self.df["Date"].to_numpy(dtype="datetime64[ns]")
+        values = self.df[self.portfolio_column].to_numpy()
+        if not self.df["Date"].is_monotonic_increasing:
+            order = np.argsort(dates, kind="stable")
+            dates, values = dates[order], values[order]
+        return dates, values
+
+    def _date_position(self, date):
+        """Position of the first row on date in the sorted arrays, or None."""
+        if date is None or pd.isna(date):
+            return None
+        dates, _ = self._sorted
+        key = pd.Timestamp(date).to_datetime64().astype("datetime64[ns]")
+        pos = int(np.searchsorted(dates, key, side="left"))
+        return pos if pos < len(dates) and dates[pos] == key else None
 
     def _get_value_by_date(self, date):
-        row = self.df[self.df["Date"] == date]
-        return row[self.portfolio_column].values[0] if not row.empty else None
+        pos = self._date_position(date)
+        return None if pos is None else self._sorted[1][pos]
 
     def calculate_performance(self):
-        periods = {
-            "one_day": self.date - timedelta(days=1),
-            "one_week": self.date - timedelta(days=7),
-            "one_month": self.date - timedelta(days=30),
-            "qtd": pd.Timestamp(
-                year=self.date.year, month=((self.date.month - 1) // 3) * 3 + 1, day=1
-            ),
-            "ytd": pd.Timestamp(year=self.date.year, month=1, day=1),
-            "one_year": self.date - timedelta(days=365),
-            "inception": self.df["Date"].min(),
-        }
-
-        performance = {}
+        # Calculate returns only if both values exist
         current_value = self._get_value_by_date(self.date)
+        if not current_value:
+            return dict.fromkeys(_PERIODS)
+
+        # Every period start is resolved below in one vectorized search over the
+        # date-ordered arrays (an as-of join without building frames)
+        dates, values = self._sorted
+        n = len(dates)
+
+        targets = np.array(
+            [
+                self.date - timedelta(days=1),
+                self.date - timedelta(days=7),
+                self.date - timedelta(days=30),
+                pd.Timestamp(
+                    year=self.date.year,
+                    month=((self.date.month - 1) // 3) * 3 + 1,
+                    day=1,
+                ),
+                pd.Timestamp(year=self.date.year, month=1, day=1),
+                self.date - timedelta(days=365),
+                # Earliest date; NaT sorts last, so this skips it like min()
+                dates[0],
+            ],
+            dtype="datetime64[ns]",
+        )
+
+        # Snap every period start to a trading day with one binary search each
+        # way, then step to the first row of that date (as a row-mask lookup would)
+        pos = np.where(
+            _SNAP_FORWARD,
+            np.searchsorted(dates, targets, side="left"),
+            np.searchsorted(dates, targets, side="right") - 1,
+        )
+        found = (pos >= 0) & (pos < n)
+        snapped = dates[np.clip(pos, 0, n - 1)]
+        found &= ~np.isnat(snapped) & ~np.isnat(targets)
+        previous_values = values[np.searchsorted(dates, snapped, side="left")]
 
-        for key, period_date in periods.items():
-            side = "right" if key in ("ytd", "qtd") else "left"
-            closest_date = self._closest_date(period_date, side=side)
-            previous_value = self._get_value_by_date(closest_date)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = (current_value / previous_values - 1) * 100
 
-            # Calculate return only if both values exist
-            performance[key] = (
-                (current_value / previous_value - 1) * 100
-                if current_value and previous_value
-                else None
-            )
+        return {
+            key: returns[i] if found[i] and previous_values[i] else None
+            for i, key in enumerate(_PERIODS)
+        }
+
+    def calculate_performance_batch(self, dates) -> pd.DataFrame:
+        """
+        calculate_performance() for many as-of dates at once, for backfills.
+
+        Returns a DataFrame indexed by the given dates with one column per
+        period; periods that calculate_performance() reports as None are NaN.
+        """
+        # Imported on first use: compiling the kernel loads numba
+        from ._returns_kernels import _period_returns_kernel
+
+        as_of = pd.DatetimeIndex(pd.to_datetime(dates))
+        current = as_of.to_numpy(dtype="datetime64[ns]")
+
+        # Period starts per as-of date, in _PERIODS order; quarter and year
+        # starts come from month/year truncation of the as-of date
+        months = current.astype("datetime64[M]")
+        quarter_start = months - months.astype(np.int64) % 3
+        history, values = self._sorted
+        # NaT sorts last: drop it so the int64 view stays sorted
+        history = history[: len(history) - np.isnat(history).sum()]
+        inception = history[0] if len(history) else np.datetime64("NaT", "ns")
+        targets = np.column_stack(
+            [
+                current - np.timedelta64(1, "D"),
+                current - np.timedelta64(7, "D"),
+                current - np.timedelta64(30, "D"),
+                quarter_start.astype("datetime64[ns]"),
+                current.astype("datetime64[Y]").astype("datetime64[ns]"),
+                current - np.timedelta64(365, "D"),
+                np.full(len(current), inception),
+            ]
+        )
 
-        return performance
+        returns = _period_returns_kernel(
+            history.view(np.int64),
+            np.ascontiguousarray(values[: len(history)], dtype=np.float64),
+            current.view(np.int64),
+            np.ascontiguousarray(targets.view(np.int64)),
+            _SNAP_FORWARD,
+        )
+        returns[np.isnat(current)] = np.nan
+        return pd.DataFrame(returns, index=as_of, columns=list(_PERIODS))
 
     def total_return(self):
         total_return = (
@@ -75,13 +154,22 @@ class ReturnsCalculator:
         ) / self.df[self.portfolio_column].iloc[0]
         return total_return
 
+    @cached_property
+    def _daily_returns(self) -> np.ndarray:
+        """NaN-free daily returns as float64, extracted once per calculator."""
+        if "pct_change" in self.df.columns:
+            returns = self.df["pct_change"]
+        else:
+            returns = self.df[self.portfolio_column].pct_change()
+        returns = returns.to_numpy(dtype=np.float64)
+        return returns[~np.isnan(returns)]
+
     def daily_average_return(self):
-        daily_returns = self.df["pct_change"].dropna()
-        return daily_returns.mean()
+        daily_returns = self._daily_returns
+        return daily_returns.mean() if daily_returns.size else np.nan
 
     def annualized_average_return(self):
-        daily_returns = self.df["pct_change"].dropna()
-        average_daily_return = daily_returns.mean()
+        average_daily_return = self.daily_average_return()
         return (1 + average_daily_return) ** 252 - 1
 
     def annualized_return(self, as_of_date=None):
@@ -97,42 +185,36 @@ class ReturnsCalculator:
         if self.df is None or self.df.empty:
             return None
 
-        df = self.df.copy()
-        df = df.sort_values("Date").reset_index(drop=True)
-
-        if self.portfolio_column not in df.columns:
+        if self.portfolio_column not in self.df.columns:
             return None
 
+        # Work on the cached date-ordered arrays, with dates normalized to days
+        # (normalizing keeps them sorted); no frame copy, sort or row masks
+        dates, values = self._sorted
+        days = dates.astype("datetime64[D]").astype("datetime64[ns]")
+
         # Determine end date - normalize to date only (remove time component)
         if as_of_date is not None:
             end_date = pd.to_datetime(as_of_date).normalize()
         elif self.date is not None:
             end_date = pd.to_datetime(self.date).normalize()
         else:
-            end_date = df["Date"].max()
-
-        # Normalize all dates in dataframe for comparison
-        df["Date"] = pd.to_datetime(df["Date"]).dt.normalize()
-        end_date = pd.to_datetime(end_date).normalize()
+            end_date = pd.Timestamp(self.df["Date"].max()).normalize()
 
-        # Get start date (inception)
-        start_date = df["Date"].min()
-
-        # Get start value
-        start_value = df[self.portfolio_column].iloc[0]
+        # Get start date (inception) and start value
+        start_date = days[0]
+        start_value = values[0]
         if start_value == 0 or pd.isna(start_value):
             return None
 
-        # Find end value - try exact match first, then closest date <= end_date
-        end_row = df[df["Date"] == end_date]
-        if end_row.empty:
-            # Fall back to closest date <= end_date
-            end_row = df[df["Date"] <= end_date]
-            if end_row.empty:
-                return None
+        # End value: the last row on end_date, or else the closest date before
+        # it - either way the last row on or before end_date (NaT sorts last)
+        end_pos = np.searchsorted(days, end_date.to_datetime64(), side="right") - 1
+        if end_pos < 0 or np.isnat(days[end_pos]):
+            return None
 
-        end_value = end_row[self.portfolio_column].iloc[-1]
-        actual_end_date = end_row["Date"].iloc[-1]
+        end_value = values[end_pos]
+        actual_end_date = days[end_pos]
 
         if pd.isna(end_value):
             return None
@@ -141,7 +223,7 @@ class ReturnsCalculator:
         total_return = (end_value / start_value) - 1.0
 
         # Calculate days held using actual end date found
-        days_held = (actual_end_date - start_date).days
+        days_held = (pd.Timestamp(actual_end_date) - pd.Timestamp(start_date)).days
         if days_held <= 0:
             return None
 
@@ -158,16 +240,35 @@ class ReturnsCalculator:
         if self.df is None or self.df.empty:
             return pd.DataFrame(columns=["Date", "Cumulative_Return_Pct"])
 
-        df = self.df.copy()
-        df = df.sort_values("Date").reset_index(drop=True)
-        if self.portfolio_column not in df.columns:
+        if self.portfolio_column not in self.df.columns:
             return pd.DataFrame(columns=["Date", "Cumulative_Return_Pct"])
 
-        starting_value = df[self.portfolio_column].iloc[0]
+        # One vectorized op over the cached date-ordered arrays; no frame copy/sort
+        dates, values = self._sorted
+        starting_value = values[0]
         if starting_value == 0 or pd.isna(starting_value):
             return pd.DataFrame(columns=["Date", "Cumulative_Return_Pct"])
 
-        df["Cumulative_Return_Pct"] = (
-            df[self.portfolio_column] / starting_value - 1.0
-        ) * 100.0
-        return df[["Date", "Cumulative_Return_Pct"]]
+        return pd.DataFrame(
+            {
+                "Date": dates,
+                "Cumulative_Return_Pct": (values / starting_value - 1.0) * 100.0,
+            }
+        )
+
+    def inception_return_pct(self):
+        """
+        Cumulative return since inception (%) at the latest date: the last point
+        of cumulative_return_series(), without building the series.
+        Returns None when there is no usable starting value.
+        """
+        if self.df is None or self.df.empty:
+            return None
+        if self.portfolio_column not in self.df.columns:
+            return None
+
+        _, values = self._sorted
+        starting_value = values[0]
+        if starting_value == 0 or pd.isna(starting_value):
+            return None
+        return float((values[-1] / starting_value - 1.0) * 100.0)
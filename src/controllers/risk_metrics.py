@@ -11,7 +11,13 @@ It provides methods for:
 This module focuses solely on risk metric calculations and assumes input data is already processed.
 """
 
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+
 from ..config.logging_config import get_logger
+from ._risk_kernels import _risk_moments_kernel
 
 # Set up logger for this module
 logger = get_logger(__name__)
@@ -22,9 +28,24 @@ class RiskMetrics:
         self.df = df
         self.RISK_FREE_RATE = risk_free_rate
 
+    @cached_property
+    def _returns(self) -> np.ndarray:
+        """NaN-free daily returns as float64, extracted once per instance."""
+        daily_returns = self.df["pct_change"].to_numpy(dtype=np.float64)
+        return daily_returns[~np.isnan(daily_returns)]
+
+    @cached_property
+    def _moments(self) -> tuple:
+        """
+        (mean, std, downside std, maximum drawdown) from one kernel pass.
+
+        Every metric below reads from this tuple, so the volatilities, the
+        ratios and compute_all() always agree with each other.
+        """
+        return tuple(np.float64(x) for x in _risk_moments_kernel(self._returns))
+
     def daily_variance(self):
-        daily_returns = self.df["pct_change"].dropna()
-        daily_variance = daily_returns.var()
+        daily_variance = self.daily_volatility() ** 2
 
         return daily_variance
 
@@ -34,23 +55,18 @@ class RiskMetrics:
         return annualized_variance
 
     def annualized_volatility(self):
-        annualized_volatility = self.annualized_variance() ** 0.5
+        annualized_volatility = self.daily_volatility() * 252**0.5
         logger.debug(f"Annualized Volatility: {annualized_volatility:.4f}")
         return annualized_volatility
 
     def daily_volatility(self):
-        # self.df = pd.read_csv(os.path.join(self.output_folder, 'portfolio_total.csv'))
-        # daily_return = self.df['Total_Portfolio_Value'].pct_change()
-        daily_return = self.df["pct_change"].dropna()
-        daily_volatility = daily_return.std()
+        daily_volatility = self._moments[1]
 
         logger.debug(f"Daily Volatility: {daily_volatility:.4f}")
         return daily_volatility
 
     def daily_downside_variance(self):
-        daily_return = self.df["pct_change"].dropna()
-        downside_returns = daily_return[daily_return < 0]
-        downside_variance = downside_returns.var()
+        downside_variance = self.daily_downside_volatility() ** 2
         logger.debug(f"Daily Downside Variance: {downside_variance:.4f}")
         return downside_variance
 
@@ -62,43 +78,67 @@ class RiskMetrics:
         return annualized_downside_variance
 
     def daily_downside_volatility(self):
-        daily_downside_volatility = self.daily_downside_variance() ** 0.5
+        daily_downside_volatility = self._moments[2]
         logger.debug(f"Daily Downside Volatility: {daily_downside_volatility:.4f}")
         return daily_downside_volatility
 
     def annualized_downside_volatility(self):
-        annualized_downside_volatility = self.annualized_downside_variance() ** 0.5
+        annualized_downside_volatility = self.daily_downside_volatility() * 252**0.5
         logger.debug(
             f"Annualized Downside Volatility: {annualized_downside_volatility:.4f}"
         )
         return annualized_downside_volatility
 
     def maximum_drawdown(self):
-        daily_returns = self.df["pct_change"].dropna()
-        if daily_returns.empty:
-            return 0.0
-
-        cumulative = (1 + daily_returns).cumprod()
-        running_max = cumulative.cummax()
-
-        drawdowns = cumulative / running_max - 1
-        max_drawdown = drawdowns.min()
+        max_drawdown = self._moments[3]
 
         return max_drawdown
 
+    def _return_moments(self):
+        """(mean, std, downside std) of the daily returns from one kernel pass."""
+        mean, std, downside_std, _ = self._moments
+        return mean, std, downside_std
+
+    def compute_all(self, risk_free_rate: Optional[float] = None) -> dict:
+        """
+        Volatility, drawdown and Sharpe/Sortino ratios from one fused pass.
+
+        The moments and the drawdown come out of a single sweep over the
+        returns (numba-compiled when available) instead of one pass per
+        method; the values match the individual methods. The risk-free rate
+        defaults to the one the instance was built with.
+        """
+        if risk_free_rate is None:
+            risk_free_rate = self.RISK_FREE_RATE
+        mean, daily_vol, downside_vol, max_drawdown = self._moments
+        excess_mean = mean - risk_free_rate / 252
+
+        sqrt_252 = 252**0.5
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily_sharpe = np.divide(excess_mean, daily_vol)
+            daily_sortino = np.divide(excess_mean, downside_vol)
+        return {
+            "daily_volatility": daily_vol,
+            "annualized_volatility": daily_vol * sqrt_252,
+            "maximum_drawdown": max_drawdown,
+            "daily_downside_volatility": downside_vol,
+            "annualized_downside_volatility": downside_vol * sqrt_252,
+            "daily_sharpe_ratio": daily_sharpe,
+            "annualized_sharpe_ratio": daily_sharpe * sqrt_252,
+            "daily_sortino_ratio": daily_sortino,
+            "annualized_sortino_ratio": daily_sortino * sqrt_252,
+        }
+
     def sharpe_ratio(self, risk_free_rate: float):
-        daily_return = self.df["pct_change"].dropna()
-        daily_sharpe_ratio = (
-            daily_return.mean() - risk_free_rate / 252
-        ) / daily_return.std()
+        mean, std, _ = self._return_moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily_sharpe_ratio = (mean - risk_free_rate / 252) / std
         annualized_sharpe_ratio = daily_sharpe_ratio * (252**0.5)
         return daily_sharpe_ratio, annualized_sharpe_ratio
 
     def sortino_ratio(self, risk_free_rate: float):
-        daily_return = self.df["pct_change"].dropna()
-        downside_returns = daily_return[daily_return < 0]
-        daily_sortino_ratio = (
-            daily_return.mean() - risk_free_rate / 252
-        ) / downside_returns.std()
+        mean, _, downside_std = self._return_moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily_sortino_ratio = (mean - risk_free_rate / 252) / downside_std
         annualized_sortino_ratio = daily_sortino_ratio * (252**0.5)
         return daily_sortino_ratio, annualized_sortino_ratio
@@ -1,6 +1,7 @@
 import os
 import sys
 from typing import Dict
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from datetime import timedelta
@@ -11,18 +12,8 @@ sys.path.insert(
     0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
-# Robust import that works both as a module and when run directly
-try:
-    from src.models.security import Security
-except ImportError:
-    from models.security import Security
-
-# Import logging - works both as module and standalone script
-try:
-    from src.config.logging_config import get_logger
-except ImportError:
-    # Fallback for standalone execution
-    from config.logging_config import get_logger
+from src.models.security import Security
+from src.config.logging_config import get_logger
 
 # Set up logger for this module
 logger = get_logger(__name__)
@@ -96,6 +87,10 @@ class Portfolio:
         self.holdings_cad = None
         self.holdings_usd = None
 
+        # yfinance lookups reused across tables (each one is a network call)
+        self.yf_currency_map = {}
+        self.split_events = None
+
         # Clean up existing CSV files before building new ones
         self.cleanup_existing_csv_files()
 
@@ -157,19 +152,33 @@ class Portfolio:
         self.trades.set_index("Date", inplace=True)
         self.tickers = sorted(self.trades["Ticker"].unique())
 
-        for _, row in self.trades.iterrows():
-            self.securities[row["Ticker"]] = Security(
-                ticker=row["Ticker"],
-                sector=row["Sector"],
-                geography=row["Geography"],
-                currency=row["Currency"],
-                asset_class=row["Asset_Class"],
+        # Security metadata comes from each ticker's latest trade row, so build it
+        # once per ticker (in first-seen order) rather than once per trade
+        metadata = (
+            self.trades.drop_duplicates("Ticker", keep="last")
+            .set_index("Ticker")
+            .reindex(self.trades["Ticker"].unique())
+        )
+        for ticker, sector, geography, currency, asset_class in zip(
+            metadata.index,
+            metadata["Sector"],
+            metadata["Geography"],
+            metadata["Currency"],
+            metadata["Asset_Class"],
+        ):
+            self.securities[ticker] = Security(
+                ticker=ticker,
+                sector=sector,
+                geography=geography,
+                currency=currency,
+                asset_class=asset_class,
             )
-            self.ticker_currency_map[row["Ticker"]] = row["Currency"]
-            if row["Currency"] == "USD":
-                self.usd_tickers.add(row["Ticker"])
-            else:
-                self.cad_tickers.add(row["Ticker"])
+            self.ticker_currency_map[ticker] = currency
+
+        # A ticker traded in both currencies lands in both sets, as before
+        is_usd = self.trades["Currency"] == "USD"
+        self.usd_tickers.update(self.trades.loc[is_usd, "Ticker"].unique())
+        self.cad_tickers.update(self.trades.loc[~is_usd, "Ticker"].unique())
 
     def load_conversions(self):
         conversions_path = os.path.join(self.input_folder, "conversions.csv")
@@ -230,7 +239,7 @@ class Portfolio:
                     )
 
             prices.index = pd.to_datetime(prices.index).tz_localize(None)
-            self.prices[ticker] = self.prices.index.map(lambda x: prices.get(x, None))
+            self.prices[ticker] = prices.reindex(self.prices.index)
 
         # Forward fill missing prices (i.e. CAD stock on holiday but US market open and vice versa)
         self.prices = self.prices.ffill()
@@ -291,10 +300,8 @@ class Portfolio:
         root = os.path.dirname(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
-        try:
-            from src.config.benchmark_yaml import load_benchmark_target_weights
-        except ImportError:
-            from config.benchmark_yaml import load_benchmark_target_weights
+        from src.config.benchmark_yaml import load_benchmark_target_weights
+
         weights = load_benchmark_target_weights(root)
         if weights:
             logger.info(f"Benchmark target weights from YAML: {weights}")
@@ -346,10 +353,11 @@ class Portfolio:
         if self.valid_dates is None or len(self.valid_dates) == 0:
             return None
 
-        # Find dates on or after target_date
-        valid_after = self.valid_dates[self.valid_dates >= target_date]
-        if len(valid_after) > 0:
-            return valid_after[0]
+        # valid_dates is a sorted union of exchange calendars, so the first date
+        # on or after target_date is one binary search away (no boolean mask)
+        pos = self.valid_dates.searchsorted(target_date, side="left")
+        if pos < len(self.valid_dates):
+            return self.valid_dates[pos]
 
         return None
 
@@ -464,6 +472,8 @@ class Portfolio:
 
             # Calculate target holdings for each ticker based on original weights
             usd_rate = float(self.exchange_rates.loc[qe_date, "USD"])
+            # Trades appended from here on belong to this quarter-end
+            qe_start = len(rebalancing_trades)
 
             for ticker, target_weight in original_weights.items():
                 if ticker not in self.prices.columns:
@@ -513,9 +523,7 @@ class Portfolio:
             # Accumulate rebalancing trades for this quarter-end to include in next simulation
             if rebalancing_trades:
                 # Get trades just added for this quarter-end
-                current_qe_trades = [
-                    t for t in rebalancing_trades if t["Date"] == qe_date
-                ]
+                current_qe_trades = rebalancing_trades[qe_start:]
                 if current_qe_trades:
                     qe_df = pd.DataFrame(current_qe_trades)
                     qe_df["Date"] = pd.to_datetime(qe_df["Date"])
@@ -544,6 +552,9 @@ class Portfolio:
         ratio (e.g., 2.0 for 2-for-1, 0.5 for 1-for-2). Dates are timezone-naive
         to match self.valid_dates.
         """
+        if self.split_events is not None:
+            return self.split_events
+
         split_events = {}
         for ticker in self.tickers:
             try:
@@ -562,85 +573,106 @@ class Portfolio:
             except Exception as e:
                 logger.warning(f"Could not fetch splits for {ticker}: {e}")
                 split_events[ticker] = {}
+        self.split_events = split_events
         return split_events
 
     def create_table_daily_holdings(self):
         # function: amount of stocks we are holding on a certain date
 
-        self.holdings = pd.DataFrame(index=self.valid_dates)
+        # Pre-fetch split events once for all tickers, grouped by date
+        split_events = self._fetch_split_events()
+        splits_by_date = {}
         for ticker in self.tickers:
-            self.holdings[ticker] = 0.0
+            for date, factor in split_events.get(ticker, {}).items():
+                splits_by_date.setdefault(date, []).append((ticker, factor))
+
+        # Trades grouped by date once (file order within a date), instead of a
+        # label lookup into the trades frame for every valid date
+        trades_by_date = {}
+        for date, ticker, quantity in zip(
+            self.trades.index, self.trades["Ticker"], self.trades["Quantity"]
+        ):
+            trades_by_date.setdefault(date, []).append((ticker, quantity))
 
-        # Pre-fetch split events once for all tickers
-        split_events = self._fetch_split_events()
+        # Share counts are carried forward in one array and copied into a
+        # preallocated row per date, rather than copying DataFrame rows by label
+        column = {ticker: j for j, ticker in enumerate(self.tickers)}
+        shares = np.zeros(len(self.tickers))
+        daily_shares = np.empty((len(self.valid_dates), len(self.tickers)))
 
         for i, date in enumerate(self.valid_dates):
-            if i != 0:
-                self.holdings.loc[date] = self.holdings.loc[self.valid_dates[i - 1]]
-
             # Apply stock splits before processing any trades of the day
-            for ticker in self.tickers:
-                factor = split_events.get(ticker, {}).get(date, None)
-                if factor is not None:
-                    shares_before = self.holdings.loc[date, ticker]
-                    if pd.notna(shares_before) and shares_before != 0.0:
-                        shares_after = shares_before * factor
-                        self.holdings.at[date, ticker] = shares_after
-                        logger.info(
-                            f"Applied stock split for {ticker} on {date.strftime('%Y-%m-%d')} "
-                            f"factor {factor:.6g}: {shares_before} -> {shares_after}"
-                        )
+            for ticker, factor in splits_by_date.get(date, ()):
+                j = column[ticker]
+                shares_before = shares[j]
+                if pd.notna(shares_before) and shares_before != 0.0:
+                    shares_after = shares_before * factor
+                    shares[j] = shares_after
+                    logger.info(
+                        f"Applied stock split for {ticker} on {date.strftime('%Y-%m-%d')} "
+                        f"factor {factor:.6g}: {shares_before} -> {shares_after}"
+                    )
 
-            if date in self.trades.index:
+            if date in trades_by_date:
                 logger.debug(f"Processing trades on {date}")
 
-                rows_for_date = self.trades.loc[date]
-
-                # Ensure rows_for_date is a DataFrame
-                # (if there is only one row, it will be a Series)
-                if isinstance(rows_for_date, pd.Series):
-                    rows_for_date = rows_for_date.to_frame().T
-                for _, row in rows_for_date.iterrows():
-                    quantity = row["Quantity"]
-                    ticker = row["Ticker"]
-                    self.holdings.at[date, ticker] = (
-                        self.holdings.loc[date, ticker] + quantity
-                    )
+                for ticker, quantity in trades_by_date[date]:
+                    j = column[ticker]
+                    shares[j] = shares[j] + quantity
 
-                    if self.holdings.loc[date, ticker] == 0.0:
+                    if shares[j] == 0.0:
                         self.securities[ticker].set_status("closed")
                     else:
                         self.securities[ticker].set_status("open")
 
+            daily_shares[i] = shares
+
+        self.holdings = pd.DataFrame(
+            daily_shares, index=self.valid_dates, columns=self.tickers
+        )
+
         pd.DataFrame(self.holdings).to_csv(
             os.path.join(self.output_folder, holdings_file), index_label="Date"
         )
 
     def create_table_cash(self):
-        # TODO: Make this currency cache a class variable potentially
-        ticker_currency_map = {}
-        for ticker in self.tickers:
-            ticker_currency_map[ticker] = yf.Ticker(ticker).info.get("currency")
+        ticker_currency_map = self._ensure_yf_currency_map()
+
+        # Trades grouped by date once (file order within a date)
+        trades_by_date = {}
+        for date, ticker, quantity, currency, price in zip(
+            self.trades.index,
+            self.trades["Ticker"],
+            self.trades["Quantity"],
+            self.trades["Currency"],
+            self.trades["Price"],
+        ):
+            trades_by_date.setdefault(date, []).append(
+                (ticker, quantity, currency, price)
+            )
 
-        self.cash = pd.DataFrame(index=self.valid_dates)
-        self.cash["CAD_Cash"] = 0.0
-        self.cash["USD_Cash"] = 0.0
-        self.cash["Total_CAD"] = 0.0
+        # Nonzero dividend payments grouped by date, in ticker order
+        dividends_by_date = {}
+        if self.dividend_income is not None:
+            div_tickers = [t for t in self.tickers if t in self.dividend_income.columns]
+            amounts = self.dividend_income[div_tickers].to_numpy(dtype=np.float64)
+            rows, cols = np.nonzero(~np.isnan(amounts) & (amounts != 0.0))
+            for r, c in zip(rows, cols):
+                dividends_by_date.setdefault(self.dividend_income.index[r], []).append(
+                    (div_tickers[c], amounts[r, c])
+                )
 
-        # Initialize starting cash (assumed to be in CAD)
-        self.cash.at[self.valid_dates[0], "CAD_Cash"] = self.STARTING_CASH
-        self.cash.at[self.valid_dates[0], "Total_CAD"] = self.STARTING_CASH
+        # Balances are carried forward in locals and written into one
+        # preallocated row per date, rather than copying DataFrame rows by label
+        # (Total_CAD is only revalued on days with cash activity, as before)
+        balances = np.empty((len(self.valid_dates), 3))
 
-        # Track current balances
+        # Track current balances (starting cash is assumed to be in CAD)
         current_cad_cash = self.STARTING_CASH
         current_usd_cash = 0.0
+        total_cad = self.STARTING_CASH
 
         for i, date in enumerate(self.valid_dates):
-            if i != 0:
-                self.cash.loc[date] = self.cash.loc[self.valid_dates[i - 1]]
-                current_cad_cash = self.cash.loc[date, "CAD_Cash"]
-                current_usd_cash = self.cash.loc[date, "USD_Cash"]
-
             # First, process explicit currency conversions for this date
             if (
                 self.conversions is not None
@@ -715,29 +747,19 @@ class Portfolio:
                             f"Unsupported currency conversion: {c_from}->{c_to}"
                         )
 
-                    # Update balances after each conversion
-                    self.cash.at[date, "CAD_Cash"] = current_cad_cash
-                    self.cash.at[date, "USD_Cash"] = current_usd_cash
+                    # Revalue the CAD total after each conversion
                     total_cad = current_cad_cash + (
                         current_usd_cash * self.exchange_rates.loc[date, "USD"]
                     )
-                    self.cash.at[date, "Total_CAD"] = total_cad
 
             # Process trades for this date
-            if date in self.trades.index:
+            if date in trades_by_date:
                 logger.info(f"--- Processing trades on {date.strftime('%Y-%m-%d')} ---")
                 logger.debug(
                     f"Starting balances - CAD: ${current_cad_cash:.2f}, USD: ${current_usd_cash:.2f}"
                 )
 
-                rows_for_date = self.trades.loc[date]
-                if isinstance(rows_for_date, pd.Series):
-                    rows_for_date = rows_for_date.to_frame().T
-                for _, row in rows_for_date.iterrows():
-                    quantity = row["Quantity"]
-                    currency = row["Currency"]
-                    price = row["Price"]
-                    ticker = row["Ticker"]
+                for ticker, quantity, currency, price in trades_by_date[date]:
                     trade_value = abs(quantity * price)
 
                     logger.debug(
@@ -776,20 +798,16 @@ class Portfolio:
                                 f"Sell: Unknown currency, increased CAD cash by ${trade_value:.2f}"
                             )
 
-                    # Update cash balances
-                    self.cash.at[date, "CAD_Cash"] = current_cad_cash
-                    self.cash.at[date, "USD_Cash"] = current_usd_cash
                     # Calculate total in CAD
                     total_cad = current_cad_cash + (
                         current_usd_cash * self.exchange_rates.loc[date, "USD"]
                     )
-                    self.cash.at[date, "Total_CAD"] = total_cad
                     logger.debug(
                         f"After trade - CAD: ${current_cad_cash:.2f}, USD: ${current_usd_cash:.2f}, Total CAD: ${total_cad:.2f}"
                     )
 
             # Process dividends for this date
-            if self.dividend_income is not None and date in self.dividend_income.index:
+            if date in dividends_by_date:
                 logger.info(
                     f"--- Processing dividends on {date.strftime('%Y-%m-%d')} ---"
                 )
@@ -797,14 +815,7 @@ class Portfolio:
                     f"Starting balances - CAD: ${current_cad_cash:.2f}, USD: ${current_usd_cash:.2f}"
                 )
 
-                for ticker in self.tickers:
-                    dividend_amount = (
-                        self.dividend_income.at[date, ticker]
-                        if ticker in self.dividend_income.columns
-                        else 0.0
-                    )
-                    if pd.isna(dividend_amount) or dividend_amount == 0.0:
-                        continue
+                for ticker, dividend_amount in dividends_by_date[date]:
                     currency = ticker_currency_map.get(ticker, "CAD")
                     logger.debug(
                         f"Dividend: {ticker} - ${dividend_amount:.2f} {currency}"
@@ -822,18 +833,22 @@ class Portfolio:
                         logger.debug(
                             f"Unknown currency, added ${dividend_amount:.2f} to CAD cash"
                         )
-                    # Update cash balances
-                    self.cash.at[date, "CAD_Cash"] = current_cad_cash
-                    self.cash.at[date, "USD_Cash"] = current_usd_cash
                     # Calculate total in CAD
                     total_cad = current_cad_cash + (
                         current_usd_cash * self.exchange_rates.loc[date, "USD"]
                     )
-                    self.cash.at[date, "Total_CAD"] = total_cad
                     logger.debug(
                         f"After dividend - CAD: ${current_cad_cash:.2f}, USD: ${current_usd_cash:.2f}, Total CAD: ${total_cad:.2f}"
                     )
 
+            balances[i] = (current_cad_cash, current_usd_cash, total_cad)
+
+        self.cash = pd.DataFrame(
+            balances,
+            index=self.valid_dates,
+            columns=["CAD_Cash", "USD_Cash", "Total_CAD"],
+        )
+
         pd.DataFrame(self.cash).to_csv(
             os.path.join(self.output_folder, cash_file), index_label="Date"
         )
@@ -907,12 +922,9 @@ class Portfolio:
         holdings = self.holdings[self.tickers]
         prices = self.prices[self.tickers]
 
-        # Convert to CAD directly using exchange rates
-        market_values = pd.DataFrame(index=self.valid_dates)
-        for ticker in self.tickers:
-            market_values[ticker] = prices[ticker] * holdings[ticker]
-
-        self.market_values = market_values
+        # Native-currency market values: one elementwise multiply of the
+        # date-aligned price and share frames
+        self.market_values = prices * holdings
         pd.DataFrame(self.market_values).to_csv(
             os.path.join(self.output_folder, market_values_file), index_label="Date"
         )
@@ -1037,11 +1049,12 @@ class Portfolio:
 
         # 3. Process Dividends - No FX needed here!
         if self.dividend_income is not None and not self.dividend_income.empty:
-            for date, row in self.dividend_income.iterrows():
-                for ticker, div_amount in row.items():
-                    if div_amount > 0 and ticker in positions:
-                        # Assumes dividend is paid in native currency (Standard behavior)
-                        positions[ticker]["total_dividends"] += div_amount
+            # Per-ticker totals of the positive payments in one vectorized pass
+            div_totals = self.dividend_income.where(self.dividend_income > 0, 0.0).sum()
+            for ticker, div_total in div_totals.items():
+                if ticker in positions:
+                    # Assumes dividend is paid in native currency (Standard behavior)
+                    positions[ticker]["total_dividends"] += div_total
 
         # 4. Build Final DataFrame
         latest_date = self.valid_dates[-1]
@@ -1111,11 +1124,6 @@ class Portfolio:
                 else:
                     annualized_return_pct = float("nan")
 
-            # --- Aggregation Prep (Normalized to CAD) ---
-            # We calculate a hidden CAD market value solely for the weighting step
-            fx_multiplier = latest_fx_usd_cad if currency == "USD" else 1.0
-            market_val_cad_calc = market_val_native * fx_multiplier
-
             sec = self.securities.get(ticker)
 
             first_purchase = first_purchase_dates.get(ticker)
@@ -1143,26 +1151,40 @@ class Portfolio:
                     * latest_fx_usd_cad,
                     "total_return_pct": return_pct,
                     "annualized_return_pct": annualized_return_pct,
-                    "mv_cad_normalized": market_val_cad_calc,
                     "invested_capital": roi_denominator,
                     "invested_capital_cad": roi_denominator * latest_fx_usd_cad,
                     # METADATA
                     "sector": sec.get_sector() if sec else "Unknown",
                     "asset_class": sec.get_asset_class() if sec else "Unknown",
-                    "status": "Open" if qty > 0 else "Closed",
                 }
             )
 
         df = pd.DataFrame(results)
 
+        # --- Aggregation Prep (Normalized to CAD) ---
+        # A hidden CAD market value solely for the weighting step, plus the
+        # open/closed label, each in one vectorized pass over the columns
+        fx_multiplier = np.where(df["currency"].eq("USD"), latest_fx_usd_cad, 1.0)
+        df.insert(
+            df.columns.get_loc("invested_capital"),
+            "mv_cad_normalized",
+            df["market_value"].to_numpy(dtype=np.float64) * fx_multiplier,
+        )
+        df["status"] = np.where(df["shares"].to_numpy() > 0, "Open", "Closed")
+
         # 5. Calculate Weights (Using the Normalized CAD values)
         # Total Portfolio Value in CAD
         total_portfolio_cad = df["mv_cad_normalized"].sum()
 
-        df["holding_weight"] = df["mv_cad_normalized"].apply(
-            lambda x: (
-                (x / total_portfolio_cad * 100.0) if total_portfolio_cad > 0 else 0.0
+        mv_cad = df["mv_cad_normalized"].to_numpy(dtype=np.float64)
+        df["holding_weight"] = (
+            np.divide(
+                mv_cad,
+                total_portfolio_cad,
+                out=np.zeros_like(mv_cad),
+                where=total_portfolio_cad > 0,
             )
+            * 100.0
         )
 
         # Sort by the implicit CAD value (Largest positions first)
@@ -1220,14 +1242,30 @@ class Portfolio:
                 ticker_currency_map[ticker] = "CAD"
         self.ticker_currency_map = ticker_currency_map
 
+    def _ensure_yf_currency_map(self):
+        """
+        Build a cached map of ticker -> currency as reported by yfinance
+        (None when unavailable), fetching each ticker's info only once.
+        """
+        for ticker in self.tickers or []:
+            if ticker in self.yf_currency_map:
+                continue
+            try:
+                self.yf_currency_map[ticker] = yf.Ticker(ticker).info.get("currency")
+            except Exception as e:
+                logger.warning(f"Could not fetch currency for {ticker}: {e}")
+                self.yf_currency_map[ticker] = None
+        return self.yf_currency_map
+
     def create_table_dividend_per_share(self):
-        self.dividend_per_share = pd.DataFrame(index=self.valid_dates)
+        # Each ticker's payouts are aligned onto the valid dates with one reindex
+        # (0.0 on non-payment days), and the frame is built in a single step
+        per_ticker = {}
         for ticker in self.tickers:
             divs = yf.Ticker(ticker).dividends.loc[self.start_date : self.end_date]
             divs.index = pd.to_datetime(divs.index).tz_localize(None)
-            self.dividend_per_share[ticker] = self.dividend_per_share.index.map(
-                lambda x: divs.get(x, 0.0)
-            )
+            per_ticker[ticker] = divs.reindex(self.valid_dates, fill_value=0.0)
+        self.dividend_per_share = pd.DataFrame(per_ticker, index=self.valid_dates)
         # Only keep rows with at least one nonzero value
         nonzero_div_per_share = self.dividend_per_share[
             (self.dividend_per_share != 0).any(axis=1)
@@ -1240,10 +1278,8 @@ class Portfolio:
     def create_table_dividend_income(self):
         holdings = self.holdings[self.tickers]
         dividend = self.dividend_per_share[self.tickers]
-        dividend_income = pd.DataFrame(index=self.valid_dates)
-        for ticker in self.tickers:
-            dividend_income[ticker] = dividend[ticker] * holdings[ticker]
-        self.dividend_income = dividend_income
+        # Both frames are indexed on valid_dates, so one multiply covers all tickers
+        self.dividend_income = dividend * holdings
         # Only keep rows with at least one nonzero value
         nonzero_div_income = self.dividend_income[
             (self.dividend_income != 0).any(axis=1)
@@ -1312,11 +1348,9 @@ class Portfolio:
         cad_dividends = 0.0
         usd_dividends = 0.0
         if self.dividend_income is not None:
+            ticker_currency_map = self._ensure_yf_currency_map()
             for ticker in self.tickers:
-                try:
-                    currency = yf.Ticker(ticker).info.get("currency", "CAD")
-                except Exception:
-                    currency = "CAD"
+                currency = ticker_currency_map.get(ticker)
 
                 ticker_dividends = self.dividend_income[ticker].sum()
                 if currency == "USD":
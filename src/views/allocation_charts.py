@@ -1,7 +1,24 @@
 import streamlit as st
 import plotly.express as px
+import numpy as np
 import pandas as pd
 import os
+from typing import Optional
+
+from src.controllers.data_service import _categorize, read_csv
+
+
+def _weight_pct(values: pd.Series, total: Optional[float] = None) -> np.ndarray:
+    """
+    Each value as a percent of total, or zeros when the total is not positive.
+
+    The total defaults to the sum of values; callers that already hold it pass
+    it in to skip the extra reduction.
+    """
+    v = values.to_numpy(dtype=np.float64)
+    if total is None:
+        total = np.nansum(v)
+    return np.divide(v, total, out=np.zeros_like(v), where=total > 0) * 100.0
 
 
 def render_allocation_charts(portfolio_name: str):
@@ -22,9 +39,11 @@ def render_allocation_charts(portfolio_name: str):
         return
 
     try:
-        # Load data directly from CSVs
-        holdings_df = pd.read_csv(holdings_path)
-        total_df = pd.read_csv(total_path)
+        # Load data directly from CSVs (pyarrow parser, memoized per file version)
+        # Label columns become categoricals, so the groupbys below bucket
+        # integer codes instead of hashing strings row by row
+        holdings_df = _categorize(read_csv(holdings_path))
+        total_df = read_csv(total_path)
     except Exception as e:
         st.error(f"Error reading data files: {e}")
         return
@@ -34,11 +53,10 @@ def render_allocation_charts(portfolio_name: str):
         return
 
     # Get totals from the last row of portfolio_total.csv (authoritative source)
-    latest_total_row = total_df.iloc[-1]
     total_portfolio_value = float(
-        latest_total_row["Total_Portfolio_Value"]
+        total_df["Total_Portfolio_Value"].iat[-1]
     )  # this includes dividends
-    total_cash_cad = float(latest_total_row["Total_Cash_CAD"])
+    total_cash_cad = float(total_df["Total_Cash_CAD"].iat[-1])
 
     if total_portfolio_value == 0:
         st.info("Portfolio value is zero")
@@ -46,7 +64,7 @@ def render_allocation_charts(portfolio_name: str):
 
     # Filter for open positions for allocation charts
     # We use shares > 0 to determine open positions
-    open_holdings_df = holdings_df[holdings_df["shares"] > 0].copy()
+    open_holdings_df = holdings_df[holdings_df["shares"] > 0]
 
     # --- Sector Allocation Calculation ---
     # Group holdings by sector and sum market_value_cad
@@ -59,33 +77,18 @@ def render_allocation_charts(portfolio_name: str):
         return
 
     # Current (does not include closed positions) allocation by sector
-    # allocation_df in previous block was just a groupby result, not the final plot data
-    # We need to construct the DataFrame used for plotting from allocation_data list
-
-    # Prepare data for plotting: Sectors + Cash
-    allocation_data = []
-
-    # Add Sectors
+    # The groupby result is the plot data; only the column labels change
     # This does not include dividends
-    sector_alloc = (
-        open_holdings_df.groupby("sector")["mv_cad_normalized"].sum().reset_index()
+    allocation_plot_df = (
+        open_holdings_df.groupby("sector", observed=True)["mv_cad_normalized"]
+        .sum()
+        .rename_axis("Sector")
+        .reset_index(name="Value")
     )
-    for _, row in sector_alloc.iterrows():
-        allocation_data.append(
-            {"Sector": row["sector"], "Value": row["mv_cad_normalized"]}
-        )
-
-    # Create final DataFrame for plotting
-    allocation_plot_df = pd.DataFrame(allocation_data)
     # We use raw Value for the pie chart to ensure Plotly calculates % correctly relative to the displayed slices.
     # Calculate percentages based on the sum of displayed values to match the pie chart surface labels
-    total_displayed_value = (
-        allocation_plot_df["Value"].sum() if not allocation_plot_df.empty else 0
-    )
-    allocation_plot_df["portfolio_weight_pct"] = (
-        (allocation_plot_df["Value"] / total_displayed_value * 100.0)
-        if total_displayed_value > 0
-        else 0.0
+    allocation_plot_df["portfolio_weight_pct"] = _weight_pct(
+        allocation_plot_df["Value"]
     )
     allocation_plot_df = allocation_plot_df.sort_values("Value", ascending=False)
 
@@ -93,30 +96,25 @@ def render_allocation_charts(portfolio_name: str):
     asset_class_df = pd.DataFrame()
     if "asset_class" in open_holdings_df.columns:
         asset_group = (
-            open_holdings_df.groupby("asset_class")["mv_cad_normalized"]
+            open_holdings_df.groupby("asset_class", observed=True)["mv_cad_normalized"]
             .sum()
-            .reset_index()
+            .rename_axis("Asset Class")
+            .reset_index(name="Value")
         )
 
-        asset_data = []
-        # Add Asset Classes
-        for _, row in asset_group.iterrows():
-            asset_data.append(
-                {"Asset Class": row["asset_class"], "Value": row["mv_cad_normalized"]}
-            )
-
         # Add Cash as an asset class
-        asset_data.append({"Asset Class": "Cash", "Value": total_cash_cad})
-
-        asset_class_df = pd.DataFrame(asset_data)
-        # Calculate percentages based on the sum of displayed values to match the pie chart surface labels
-        total_asset_value = (
-            asset_class_df["Value"].sum() if not asset_class_df.empty else 0
+        asset_class_df = pd.concat(
+            [
+                asset_group,
+                pd.DataFrame({"Asset Class": ["Cash"], "Value": [total_cash_cad]}),
+            ],
+            ignore_index=True,
         )
-        asset_class_df["portfolio_weight_pct"] = (
-            (asset_class_df["Value"] / total_asset_value * 100.0)
-            if total_asset_value > 0
-            else 0.0
+        # Calculate percentages based on the sum of displayed values to match the pie chart surface labels
+        # (the holdings total plus the cash row appended above)
+        total_asset_value = asset_group["Value"].sum() + total_cash_cad
+        asset_class_df["portfolio_weight_pct"] = _weight_pct(
+            asset_class_df["Value"], total_asset_value
         )
         asset_class_df = asset_class_df.sort_values(
             "portfolio_weight_pct", ascending=False
@@ -194,7 +192,7 @@ def render_sector_performance(df: pd.DataFrame):
     # )
 
     sector_grp = (
-        df.groupby("sector")
+        df.groupby("sector", observed=True)
         .agg(
             # Numerator: Sum of all returns (Realized + Unrealized + Divs) in CAD
             total_return_cad=("total_return_cad_normalized", "sum"),
@@ -207,20 +205,21 @@ def render_sector_performance(df: pd.DataFrame):
     )
 
     # Sector ROI Percentage
-    sector_grp["total_return_pct"] = sector_grp.apply(
-        lambda x: (
-            (x["total_return_cad"] / x["total_invested_cad"] * 100.0)
-            if x["total_invested_cad"] > 0
-            else 0.0
-        ),
-        axis=1,
+    # Column-wise division; sectors with no invested capital get 0%
+    total_return_cad = sector_grp["total_return_cad"].to_numpy(dtype=np.float64)
+    total_invested_cad = sector_grp["total_invested_cad"].to_numpy(dtype=np.float64)
+    sector_grp["total_return_pct"] = (
+        np.divide(
+            total_return_cad,
+            total_invested_cad,
+            out=np.zeros_like(total_return_cad),
+            where=total_invested_cad > 0,
+        )
+        * 100.0
     )
 
-    total_portfolio_val = sector_grp["market_value_cad"].sum()  # Doesn't include cash
-
-    sector_grp["portfolio_weight_pct"] = sector_grp["market_value_cad"].apply(
-        lambda x: (x / total_portfolio_val * 100.0) if total_portfolio_val > 0 else 0.0
-    )
+    # Weights against the summed sector market value (doesn't include cash)
+    sector_grp["portfolio_weight_pct"] = _weight_pct(sector_grp["market_value_cad"])
 
     final_cols = [
         "sector",
@@ -5,6 +5,50 @@ Holdings Table Component - Reusable UI component for displaying portfolio holdin
 import streamlit as st
 import pandas as pd
 
+# Holdings columns shown in the table, in display order.
+_HOLDINGS_COLUMNS = [
+    "ticker",
+    "currency",
+    "shares",
+    "first_purchase_date",  # ✅ ADDED COLUMN
+    "holding_weight",
+    "current_price",
+    "avg_price",
+    "market_value",
+    "book_value",
+    "dividends",
+    "realized_pnl",
+    "unrealized_pnl",
+    "total_return",
+    "total_return_pct",
+    "annualized_return_pct",
+    "sector",
+    "asset_class",
+    "status",
+]
+
+# Display labels for the holdings columns.
+_HOLDINGS_LABELS = {
+    "ticker": "Ticker",
+    "currency": "Currency",
+    "shares": "Shares",
+    "first_purchase_date": "First Purchase Date",  # ✅ RENAME
+    "holding_weight": "Weight (%)",
+    "current_price": "Price",
+    "avg_price": "Avg Cost",
+    "market_value": "Market Value",
+    "book_value": "Book Value",
+    "dividends": "Dividends",
+    "realized_pnl": "Realized PnL",
+    "unrealized_pnl": "Unrealized PnL",
+    "total_return": "Total Return ($)",
+    "total_return_pct": "Total Return (%)",
+    "annualized_return_pct": "Annualized Return (%)",
+    "sector": "Sector",
+    "asset_class": "Asset Class",
+    "status": "Status",
+}
+
 
 def render_holdings_table(holdings_data: pd.DataFrame):
     st.header("Portfolio Holdings")
@@ -23,56 +67,13 @@ def render_holdings_table(holdings_data: pd.DataFrame):
     if selected_tickers:
         display_data = holdings_data[holdings_data["ticker"].isin(selected_tickers)]
     else:
-        display_data = holdings_data.copy()
+        display_data = holdings_data
 
     if not holdings_data.empty:
-        # Select columns to show
-        cols = [
-            "ticker",
-            "currency",
-            "shares",
-            "first_purchase_date",  # ✅ ADDED COLUMN
-            "holding_weight",
-            "current_price",
-            "avg_price",
-            "market_value",
-            "book_value",
-            "dividends",
-            "realized_pnl",
-            "unrealized_pnl",
-            "total_return",
-            "total_return_pct",
-            "annualized_return_pct",
-            "sector",
-            "asset_class",
-            "status",
-        ]
-
         # Filter to available columns
-        cols = [c for c in cols if c in display_data.columns]
+        cols = [c for c in _HOLDINGS_COLUMNS if c in display_data.columns]
 
-        df_show = display_data[cols].rename(
-            columns={
-                "ticker": "Ticker",
-                "currency": "Currency",
-                "shares": "Shares",
-                "first_purchase_date": "First Purchase Date",  # ✅ RENAME
-                "holding_weight": "Weight (%)",
-                "current_price": "Price",
-                "avg_price": "Avg Cost",
-                "market_value": "Market Value",
-                "book_value": "Book Value",
-                "dividends": "Dividends",
-                "realized_pnl": "Realized PnL",
-                "unrealized_pnl": "Unrealized PnL",
-                "total_return": "Total Return ($)",
-                "total_return_pct": "Total Return (%)",
-                "annualized_return_pct": "Annualized Return (%)",
-                "sector": "Sector",
-                "asset_class": "Asset Class",
-                "status": "Status",
-            }
-        )
+        df_show = display_data[cols].rename(columns=_HOLDINGS_LABELS)
 
         # Render table
         st.dataframe(
@@ -141,11 +142,11 @@ def render_holdings_summary(holdings_data: pd.DataFrame):
         with col3:
             st.metric(
                 "Largest Position (Native)",
-                f"${holdings_data.iloc[0]['market_value']:,.0f}",
+                f"${holdings_data['market_value'].max():,.0f}",
             )
         with col4:
             st.metric(
                 "Smallest Position (Native)",
-                f"${holdings_data.iloc[-1]['market_value']:,.0f}",
+                f"${holdings_data['market_value'].min():,.0f}",
             )
         st.markdown("---")
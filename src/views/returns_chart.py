@@ -6,10 +6,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-try:
-    from src.config.benchmark_yaml import format_benchmark_target_allocation_caption
-except ImportError:
-    from config.benchmark_yaml import format_benchmark_target_allocation_caption
+from src.config.benchmark_yaml import format_benchmark_target_allocation_caption
 
 BENCHMARK_ALLOCATION_RATIONALE = (
     "We shifted the portfolio allocation from 60/40 to 70/30 primarily to capitalize on "
@@ -34,8 +31,10 @@ def render_returns_chart(returns_df: pd.DataFrame):
     # 	st.info("Returns data not available.")
     # 	return
 
-    df = returns_df.copy()
-    df = df.sort_values("Date")
+    # Only read from here on; the controller already returns it in date order
+    df = returns_df
+    if not df["Date"].is_monotonic_increasing:
+        df = df.sort_values("Date")
 
     fig = px.line(
         df,
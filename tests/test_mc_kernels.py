@@ -0,0 +1,107 @@
+# ruff: noqa: E402
+"""Unit tests for the market comparison numeric kernels."""
+
+import importlib
+import os
+import sys
+import types
+import unittest
+
+import numpy as np
+import pandas as pd
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+# Import the kernels without loading controllers/__init__.py (that pulls in
+# market_comparison → getFamaFrenchFactors, which may be missing in some envs).
+_src_path = os.path.join(parent_dir, "src")
+_controllers_path = os.path.join(_src_path, "controllers")
+if "src" not in sys.modules:
+    _src_pkg = types.ModuleType("src")
+    _src_pkg.__path__ = [_src_path]
+    sys.modules["src"] = _src_pkg
+if "src.controllers" not in sys.modules:
+    _ctrl_pkg = types.ModuleType("src.controllers")
+    _ctrl_pkg.__path__ = [_controllers_path]
+    sys.modules["src.controllers"] = _ctrl_pkg
+
+_mc_kernels = importlib.import_module("src.controllers._mc_kernels")
+
+
+class TestBetaIrKernel(unittest.TestCase):
+    """The fused kernel must agree with the pandas reductions it replaces."""
+
+    def setUp(self):
+        self.portfolio = pd.Series([0.01, 0.02, -0.01, 0.03, 0.02, -0.005])
+        self.benchmark = pd.Series([0.005, 0.01, -0.005, 0.015, 0.01, 0.002])
+        self.x = self.portfolio.to_numpy(dtype=np.float64)
+        self.y = self.benchmark.to_numpy(dtype=np.float64)
+
+    def _assert_matches_pandas(self, kernel):
+        cov, var_b, excess_mean, excess_std = kernel(self.x, self.y)
+        excess = self.portfolio - self.benchmark
+        self.assertAlmostEqual(cov, self.portfolio.cov(self.benchmark), places=12)
+        self.assertAlmostEqual(var_b, self.benchmark.var(), places=12)
+        self.assertAlmostEqual(excess_mean, excess.mean(), places=12)
+        self.assertAlmostEqual(excess_std, excess.std(), places=12)
+
+    def test_kernel_matches_pandas(self):
+        self._assert_matches_pandas(_mc_kernels._beta_ir_kernel)
+
+    def test_numpy_fallback_matches_pandas(self):
+        self._assert_matches_pandas(_mc_kernels._beta_ir_numpy)
+
+    def test_float32_storage_matches_float64(self):
+        x32 = self.x.astype(np.float32)
+        y32 = self.y.astype(np.float32)
+        for kernel in (_mc_kernels._beta_ir_kernel, _mc_kernels._beta_ir_numpy):
+            expected = kernel(self.x, self.y)
+            for got, want in zip(kernel(x32, y32), expected):
+                self.assertAlmostEqual(got, want, places=7)
+
+        # Both paths widen float32 elements before any arithmetic, so they agree
+        # to float64 rounding on float32 input, not just to float32 precision
+        rng = np.random.default_rng(11)
+        x32 = rng.normal(0.0004, 0.01, size=2500).astype(np.float32)
+        y32 = rng.normal(0.0003, 0.009, size=2500).astype(np.float32)
+        np.testing.assert_allclose(
+            _mc_kernels._beta_ir_kernel(x32, y32),
+            _mc_kernels._beta_ir_numpy(x32, y32),
+            rtol=1e-10,
+        )
+
+    def test_single_observation_is_nan(self):
+        cov, var_b, _, excess_std = _mc_kernels._beta_ir_kernel(self.x[:1], self.y[:1])
+        self.assertTrue(np.isnan(cov))
+        self.assertTrue(np.isnan(var_b))
+        self.assertTrue(np.isnan(excess_std))
+
+
+class TestFf3MomentsKernel(unittest.TestCase):
+    """The streaming FF3 moments must match np.mean / np.cov."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.m = rng.normal(0.005, 0.04, size=(60, 4))
+
+    def _assert_matches_numpy(self, kernel):
+        means, cov = kernel(self.m)
+        np.testing.assert_allclose(means, self.m.mean(axis=0), rtol=0, atol=1e-14)
+        np.testing.assert_allclose(
+            cov, np.cov(self.m, rowvar=False, ddof=1), rtol=0, atol=1e-14
+        )
+
+    def test_kernel_matches_numpy(self):
+        self._assert_matches_numpy(_mc_kernels._ff3_moments_kernel)
+
+    def test_numpy_fallback_matches_numpy(self):
+        self._assert_matches_numpy(_mc_kernels._ff3_moments_numpy)
+
+    def test_single_row_covariance_is_nan(self):
+        _, cov = _mc_kernels._ff3_moments_kernel(self.m[:1])
+        self.assertTrue(np.isnan(cov).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# ruff: noqa: E402
+"""Unit tests for portfolio period returns (ReturnsCalculator)."""
+
+import importlib
+import os
+import sys
+import types
+import unittest
+
+import pandas as pd
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+# Import ReturnsCalculator without loading controllers/__init__.py (that pulls in
+# market_comparison → getFamaFrenchFactors, which may be missing in some envs).
+_src_path = os.path.join(parent_dir, "src")
+_controllers_path = os.path.join(_src_path, "controllers")
+if "src" not in sys.modules:
+    _src_pkg = types.ModuleType("src")
+    _src_pkg.__path__ = [_src_path]
+    sys.modules["src"] = _src_pkg
+if "src.controllers" not in sys.modules:
+    _ctrl_pkg = types.ModuleType("src.controllers")
+    _ctrl_pkg.__path__ = [_controllers_path]
+    sys.modules["src.controllers"] = _ctrl_pkg
+
+ReturnsCalculator = importlib.import_module(
+    "src.controllers.returns_calculator"
+).ReturnsCalculator
+
+
+def _totals_df(values_by_date):
+    """Build a DataFrame with Date / Total_Portfolio_Value columns."""
+    return pd.DataFrame(
+        {
+            "Date": pd.to_datetime(list(values_by_date)),
+            "Total_Portfolio_Value": list(values_by_date.values()),
+        }
+    )
+
+
+class TestCalculatePerformance(unittest.TestCase):
+    """Period starts snap to trading days present in the data."""
+
+    def setUp(self):
+        self.df = _totals_df(
+            {
+                "2024-03-28": 100.0,
+                "2024-04-02": 110.0,  # first trading day of Q2
+                "2024-06-24": 120.0,
+                "2024-06-28": 125.0,
+                "2024-07-01": 130.0,
+            }
+        )
+
+    def test_period_returns(self):
+        perf = ReturnsCalculator(self.df, "2024-07-01").calculate_performance()
+        # One day back from 07-01 has no row: snap back to 06-28
+        self.assertAlmostEqual(perf["one_day"], (130 / 125 - 1) * 100)
+        # One week back (06-24) is present
+        self.assertAlmostEqual(perf["one_week"], (130 / 120 - 1) * 100)
+        # One month back (06-01) snaps back to 04-02
+        self.assertAlmostEqual(perf["one_month"], (130 / 110 - 1) * 100)
+        # QTD starts on 07-01 itself
+        self.assertAlmostEqual(perf["qtd"], 0.0)
+        # YTD snaps forward to the first row of the year
+        self.assertAlmostEqual(perf["ytd"], (130 / 100 - 1) * 100)
+        self.assertAlmostEqual(perf["inception"], (130 / 100 - 1) * 100)
+        # Nothing on or before a year back
+        self.assertIsNone(perf["one_year"])
+
+    def test_unsorted_input_matches_sorted(self):
+        expected = ReturnsCalculator(self.df, "2024-06-28").calculate_performance()
+        shuffled = self.df.iloc[[3, 0, 4, 2, 1]]
+        actual = ReturnsCalculator(shuffled, "2024-06-28").calculate_performance()
+        self.assertEqual(actual, expected)
+
+    def test_missing_date_returns_none(self):
+        perf = ReturnsCalculator(self.df, "2024-05-01").calculate_performance()
+        self.assertTrue(all(value is None for value in perf.values()))
+
+
+class TestCalculatePerformanceBatch(unittest.TestCase):
+    """The batch kernel agrees with calculate_performance() date by date."""
+
+    def test_matches_single_date_results(self):
+        df = _totals_df(
+            {
+                "2024-03-28": 100.0,
+                "2024-04-02": 110.0,
+                "2024-06-24": 120.0,
+                "2024-06-28": 0.0,
+                "2024-07-01": 130.0,
+            }
+        ).iloc[[4, 0, 2, 1, 3]]
+        dates = list(df["Date"]) + [pd.Timestamp("2024-05-01")]
+        batch = ReturnsCalculator(df).calculate_performance_batch(dates)
+        self.assertEqual(list(batch.index), dates)
+        for date in dates:
+            perf = ReturnsCalculator(df, date).calculate_performance()
+            for key, value in perf.items():
+                actual = batch.at[date, key]
+                if value is None:
+                    self.assertTrue(pd.isna(actual), (date, key))
+                else:
+                    self.assertAlmostEqual(actual, value, msg=(date, key))
+
+
+class TestInceptionReturn(unittest.TestCase):
+    """The scalar matches the last point of the cumulative return series."""
+
+    def test_matches_series_tail(self):
+        df = _totals_df({"2024-01-03": 120.0, "2024-01-01": 100.0, "2024-01-02": 90.0})
+        calc = ReturnsCalculator(df)
+        series = calc.cumulative_return_series()["Cumulative_Return_Pct"]
+        self.assertEqual(calc.inception_return_pct(), series.iloc[-1])
+        self.assertAlmostEqual(calc.inception_return_pct(), 20.0)
+
+    def test_zero_start_is_none(self):
+        df = _totals_df({"2024-01-01": 0.0, "2024-01-02": 90.0})
+        self.assertIsNone(ReturnsCalculator(df).inception_return_pct())
+        self.assertIsNone(ReturnsCalculator(df.iloc[:0]).inception_return_pct())
+
+
+class TestAnnualizedReturn(unittest.TestCase):
+    """End values come from the last row on or before the as-of date."""
+
+    def setUp(self):
+        self.df = _totals_df(
+            {"2023-01-01": 100.0, "2023-07-01": 105.0, "2024-01-01": 110.0}
+        )
+
+    def test_exact_and_fallback_dates(self):
+        calc = ReturnsCalculator(self.df)
+        # Exactly 365 days held, so the annualized return is the total return
+        self.assertAlmostEqual(calc.annualized_return("2024-01-01"), 10.0)
+        # 2023-12-15 has no row: falls back to 2023-07-01 (181 days held)
+        expected = (1.05 ** (365.0 / 181) - 1.0) * 100.0
+        self.assertAlmostEqual(calc.annualized_return("2023-12-15"), expected)
+        self.assertIsNone(calc.annualized_return("2022-12-31"))
+
+    def test_unsorted_input_matches_sorted(self):
+        shuffled = self.df.iloc[[2, 0, 1]]
+        for as_of in (None, "2023-12-15", "2024-01-01"):
+            self.assertEqual(
+                ReturnsCalculator(shuffled).annualized_return(as_of),
+                ReturnsCalculator(self.df).annualized_return(as_of),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
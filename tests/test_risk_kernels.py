@@ -0,0 +1,80 @@
+# ruff: noqa: E402
+"""Unit tests for the portfolio risk numeric kernels."""
+
+import importlib
+import os
+import sys
+import types
+import unittest
+
+import numpy as np
+import pandas as pd
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+# Import the kernels without loading controllers/__init__.py (that pulls in
+# market_comparison → getFamaFrenchFactors, which may be missing in some envs).
+_src_path = os.path.join(parent_dir, "src")
+_controllers_path = os.path.join(_src_path, "controllers")
+if "src" not in sys.modules:
+    _src_pkg = types.ModuleType("src")
+    _src_pkg.__path__ = [_src_path]
+    sys.modules["src"] = _src_pkg
+if "src.controllers" not in sys.modules:
+    _ctrl_pkg = types.ModuleType("src.controllers")
+    _ctrl_pkg.__path__ = [_controllers_path]
+    sys.modules["src.controllers"] = _ctrl_pkg
+
+_risk_kernels = importlib.import_module("src.controllers._risk_kernels")
+RiskMetrics = importlib.import_module("src.controllers.risk_metrics").RiskMetrics
+
+
+class TestRiskMomentsKernel(unittest.TestCase):
+    """The fused kernel must agree with the RiskMetrics methods it replaces."""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.returns = rng.normal(0.0004, 0.01, size=500)
+        self.risk_metrics = RiskMetrics(pd.DataFrame({"pct_change": self.returns}))
+
+    def _assert_matches_risk_metrics(self, kernel):
+        mean, std, downside_std, max_drawdown = kernel(self.returns)
+        self.assertAlmostEqual(mean, self.returns.mean(), places=12)
+        self.assertAlmostEqual(std, self.risk_metrics.daily_volatility(), places=12)
+        self.assertAlmostEqual(
+            downside_std, self.risk_metrics.daily_downside_volatility(), places=12
+        )
+        self.assertAlmostEqual(
+            max_drawdown, self.risk_metrics.maximum_drawdown(), places=12
+        )
+
+    def test_kernel_matches_risk_metrics(self):
+        self._assert_matches_risk_metrics(_risk_kernels._risk_moments_kernel)
+
+    def test_numpy_fallback_matches_risk_metrics(self):
+        self._assert_matches_risk_metrics(_risk_kernels._risk_moments_numpy)
+
+    def test_empty_returns(self):
+        for kernel in (
+            _risk_kernels._risk_moments_kernel,
+            _risk_kernels._risk_moments_numpy,
+        ):
+            _, std, downside_std, max_drawdown = kernel(np.empty(0))
+            self.assertTrue(np.isnan(std))
+            self.assertTrue(np.isnan(downside_std))
+            self.assertEqual(max_drawdown, 0.0)
+
+    def test_no_downside_is_nan(self):
+        for kernel in (
+            _risk_kernels._risk_moments_kernel,
+            _risk_kernels._risk_moments_numpy,
+        ):
+            _, std, downside_std, max_drawdown = kernel(np.array([0.01, 0.02, 0.03]))
+            self.assertAlmostEqual(std, 0.01, places=12)
+            self.assertTrue(np.isnan(downside_std))
+            self.assertEqual(max_drawdown, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
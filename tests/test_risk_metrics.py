@@ -155,6 +155,39 @@ class TestRiskMetricsSharpeSortino(unittest.TestCase):
         self.assertAlmostEqual(annualized_sortino, expected_annual, places=10)
 
 
+class TestRiskMetricsComputeAll(unittest.TestCase):
+    """compute_all() agrees with the individual metric methods."""
+
+    def setUp(self):
+        self.df = _returns_df([None, 0.01, -0.005, 0.02, 0.015, -0.01, 0.02, -0.03])
+        self.risk_metrics = RiskMetrics(self.df, risk_free_rate=0.02)
+
+    def test_matches_individual_methods(self):
+        rm = self.risk_metrics
+        result = rm.compute_all()
+        daily_sharpe, annualized_sharpe = rm.sharpe_ratio(0.02)
+        daily_sortino, annualized_sortino = rm.sortino_ratio(0.02)
+        expected = {
+            "daily_volatility": rm.daily_volatility(),
+            "annualized_volatility": rm.annualized_volatility(),
+            "maximum_drawdown": rm.maximum_drawdown(),
+            "daily_downside_volatility": rm.daily_downside_volatility(),
+            "annualized_downside_volatility": rm.annualized_downside_volatility(),
+            "daily_sharpe_ratio": daily_sharpe,
+            "annualized_sharpe_ratio": annualized_sharpe,
+            "daily_sortino_ratio": daily_sortino,
+            "annualized_sortino_ratio": annualized_sortino,
+        }
+        # Exactly equal: every metric reads the same fused moments
+        self.assertEqual(result, expected)
+
+    def test_risk_free_rate_override(self):
+        default = self.risk_metrics.compute_all()
+        overridden = self.risk_metrics.compute_all(0.05)
+        self.assertEqual(default["daily_volatility"], overridden["daily_volatility"])
+        self.assertLess(overridden["daily_sharpe_ratio"], default["daily_sharpe_ratio"])
+
+
 class TestRiskMetricsEdgeCases(unittest.TestCase):
     """Edge cases: single return, risk_free_rate."""
 